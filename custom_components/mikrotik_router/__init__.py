@@ -10,7 +10,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry
 from homeassistant.config_entries import ConfigEntry
 
-from homeassistant.const import CONF_VERIFY_SSL
+from homeassistant.const import CONF_VERIFY_SSL, EVENT_HOMEASSISTANT_STOP
 
 from .const import PLATFORMS, DOMAIN, DEFAULT_VERIFY_SSL
 from .coordinator import MikrotikData, MikrotikCoordinator, MikrotikTrackerCoordinator
@@ -28,9 +28,28 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up a config entry."""
     coordinator = MikrotikCoordinator(hass, config_entry)
-    await coordinator.async_config_entry_first_refresh()
     coordinatorTracker = MikrotikTrackerCoordinator(hass, config_entry, coordinator)
-    await coordinatorTracker.async_config_entry_first_refresh()
+    if await coordinator.async_load_snapshot():
+        # Set up entities from the snapshot, live data follows in the background
+        coordinator.async_set_updated_data(coordinator.ds)
+        coordinatorTracker.async_set_updated_data(
+            {
+                "host": coordinator.ds["host"],
+                "routerboard": coordinator.ds["routerboard"],
+            }
+        )
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {coordinator.host} refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        await coordinatorTracker.async_config_entry_first_refresh()
+
+    # Not async_listen_once, its remover must not be called after stop fired
+    config_entry.async_on_unload(
+        hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, coordinator.async_save_snapshot)
+    )
+
     hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = MikrotikData(
         data_coordinator=coordinator,
         tracker_coordinator=coordinatorTracker,
@@ -60,7 +79,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     if unload_ok := await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     ):
-        hass.data[DOMAIN].pop(config_entry.entry_id)
+        data = hass.data[DOMAIN].pop(config_entry.entry_id)
+        await data.tracker_coordinator.async_shutdown()
+        await data.data_coordinator.async_shutdown()
 
     return unload_ok
 
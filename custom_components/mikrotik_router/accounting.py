@@ -0,0 +1,151 @@
+"""Accounting snapshot aggregation for Mikrotik Router."""
+
+from __future__ import annotations
+
+from ipaddress import IPv4Address
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TRAFFIC_KEYS = ("wan-tx", "wan-rx", "lan-tx", "lan-rx")
+
+
+# ---------------------------
+#   ip_to_int
+# ---------------------------
+def ip_to_int(address) -> int:
+    """Return IPv4 address as integer, -1 if it is not valid.
+
+    Only dotted quads are valid, short and hex forms are rejected.
+    """
+    try:
+        return int(IPv4Address(address))
+    except ValueError:
+        return -1
+
+
+# ---------------------------
+#   aggregate_traffic
+# ---------------------------
+def aggregate_traffic(snapshot, classifier, addresses) -> dict:
+    """Sum accounting snapshot bytes per host address.
+
+    snapshot rows hold src-address, dst-address and bytes. classifier is
+    the NetworkClassifier of local networks, traffic between two local
+    addresses is LAN, everything else WAN. Returns wan/lan tx/rx byte
+    counts for every address in addresses.
+    """
+    snapshot = list(snapshot)
+    src = [str(row.get("src-address")).strip() for row in snapshot]
+    dst = [str(row.get("dst-address")).strip() for row in snapshot]
+    size = [int(str(row.get("bytes")).strip()) for row in snapshot]
+    if np is not None and snapshot:
+        return _aggregate_numpy(src, dst, size, classifier, addresses)
+
+    return _aggregate_python(src, dst, size, classifier, addresses)
+
+
+# ---------------------------
+#   _aggregate_python
+# ---------------------------
+def _aggregate_python(src, dst, size, classifier, addresses) -> dict:
+    """Aggregate traffic, classifying every distinct address once."""
+    traffic = {address: dict.fromkeys(TRAFFIC_KEYS, 0) for address in addresses}
+    local = {}
+
+    def is_local(address) -> bool:
+        if address not in local:
+            value = ip_to_int(address)
+            local[address] = value >= 0 and classifier.lookup_int(value) is not None
+
+        return local[address]
+
+    for source_ip, destination_ip, bits_count in zip(src, dst, size):
+        src_local = is_local(source_ip)
+        dst_local = is_local(destination_ip)
+        if src_local and dst_local:
+            # LAN TX/RX
+            if source_ip in traffic:
+                traffic[source_ip]["lan-tx"] += bits_count
+            if destination_ip in traffic:
+                traffic[destination_ip]["lan-rx"] += bits_count
+        elif src_local:
+            # WAN TX
+            if source_ip in traffic:
+                traffic[source_ip]["wan-tx"] += bits_count
+        elif dst_local and destination_ip in traffic:
+            # WAN RX
+            traffic[destination_ip]["wan-rx"] += bits_count
+
+    return traffic
+
+
+# ---------------------------
+#   _aggregate_numpy
+# ---------------------------
+def _aggregate_numpy(src, dst, size, classifier, addresses) -> dict:
+    """Aggregate traffic with vectorized classification and group-by."""
+    addresses = list(dict.fromkeys(addresses))
+    parsed = {}
+
+    def to_array(values):
+        for value in set(values).difference(parsed):
+            parsed[value] = ip_to_int(value)
+
+        return np.fromiter(
+            map(parsed.__getitem__, values), dtype=np.int64, count=len(values)
+        )
+
+    src_int = to_array(src)
+    dst_int = to_array(dst)
+    size = np.asarray(size, dtype=np.float64)
+
+    starts, covered = classifier.ranges(4)
+    starts = np.asarray(starts, dtype=np.int64)
+    covered = np.asarray(covered + [False], dtype=bool)
+
+    def is_local(values):
+        # Addresses before the first range index the trailing False
+        return covered[np.searchsorted(starts, values, side="right") - 1] & (
+            values >= 0
+        )
+
+    src_local = is_local(src_int)
+    dst_local = is_local(dst_int)
+
+    # Group by host, rows are matched to hosts by binary search
+    host_int = to_array(addresses)
+    order = np.argsort(host_int)
+    host_sorted = host_int[order]
+
+    def host_index(values):
+        if not len(host_sorted):
+            return np.zeros(len(values), dtype=np.intp), np.zeros(
+                len(values), dtype=bool
+            )
+
+        pos = np.minimum(np.searchsorted(host_sorted, values), len(host_sorted) - 1)
+        return order[pos], (host_sorted[pos] == values) & (values >= 0)
+
+    src_idx, src_host = host_index(src_int)
+    dst_idx, dst_host = host_index(dst_int)
+
+    def group_sum(idx, selected):
+        return np.bincount(
+            idx[selected], weights=size[selected], minlength=len(addresses)
+        )
+
+    lan = src_local & dst_local
+    totals = {
+        "lan-tx": group_sum(src_idx, lan & src_host),
+        "lan-rx": group_sum(dst_idx, lan & dst_host),
+        "wan-tx": group_sum(src_idx, src_local & ~dst_local & src_host),
+        "wan-rx": group_sum(dst_idx, ~src_local & dst_local & dst_host),
+    }
+
+    return {
+        address: {key: int(totals[key][idx]) for key in TRAFFIC_KEYS}
+        for idx, address in enumerate(addresses)
+    }
@@ -1,14 +1,17 @@
 """API parser for JSON APIs."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from logging import getLogger
+from logging import DEBUG, getLogger
 
 from pytz import utc
 from voluptuous import Optional
 
 from homeassistant.components.diagnostics import async_redact_data
 
-from .const import TO_REDACT
+from .compactrow import get_row_class
+from .const import DEBUG_SAMPLE_EVERY, DEBUG_SAMPLE_FIRST, TO_REDACT
+from .indexedtable import IndexedTable
 
 _LOGGER = getLogger(__name__)
 
@@ -80,6 +83,60 @@ def from_entry_bool(entry, param, default=False, reverse=False) -> bool:
     return not ret if reverse else ret
 
 
+# ---------------------------
+#   Redacted
+# ---------------------------
+class Redacted:
+    """Log argument redacted only when the record is formatted."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        """Initialize with data to redact."""
+        self.data = data
+
+    def __str__(self) -> str:
+        """Return redacted data."""
+        return str(async_redact_data(self.data, TO_REDACT))
+
+
+# ---------------------------
+#   get_logger
+# ---------------------------
+def get_logger(path=None):
+    """Return parse logger for an API path.
+
+    Debug for a single collector is enabled on its child logger, e.g.
+    custom_components.mikrotik_router.apiparser.ip.arp
+    """
+    if not path:
+        return _LOGGER
+
+    return _LOGGER.getChild(path.strip("/").replace("/", "."))
+
+
+# ---------------------------
+#   ParseChanges
+# ---------------------------
+@dataclass
+class ParseChanges:
+    """Change-set of a parse_api call.
+
+    changed maps uid to the names of fields whose value changed. Unkeyed
+    sources report their changed fields under uid None. removed holds uids
+    present in data but missing from a keyed source.
+    """
+
+    added: set = field(default_factory=set)
+    removed: set = field(default_factory=set)
+    changed: dict = field(default_factory=dict)
+
+    @property
+    def updated(self) -> set:
+        """Return uids of added or changed rows."""
+        return self.added.union(self.changed)
+
+
 # ---------------------------
 #   parse_api
 # ---------------------------
@@ -94,51 +151,223 @@ def parse_api(
     ensure_vals=None,
     only=None,
     skip=None,
-) -> dict:
-    """Get data from API."""
-    debug = _LOGGER.getEffectiveLevel() == 10
+    track_changes=False,
+    compact=False,
+    path=None,
+    debug_first=DEBUG_SAMPLE_FIRST,
+    debug_every=DEBUG_SAMPLE_EVERY,
+) -> dict | tuple:
+    """Get data from API.
+
+    With track_changes, return (data, ParseChanges) instead of data. An
+    empty source list means the table is empty, None that it is unknown.
+    With compact, new rows are CompactRow mappings instead of dicts.
+    Debug logs the first debug_first entries and every debug_every-th.
+    """
     if type(source) == dict:
         tmp = source
         source = [tmp]
 
-    if not source:
-        if not key and not key_search:
-            data = fill_defaults(data, vals)
-        return data
+    parser = RowParser(
+        data,
+        key,
+        key_secondary,
+        key_search,
+        vals,
+        val_proc,
+        ensure_vals,
+        only,
+        skip,
+        track_changes,
+        compact,
+        path,
+        debug_first,
+        debug_every,
+    )
+    if source:
+        feed = parser.feed
+        for entry in source:
+            feed(entry)
 
-    if debug:
-        _LOGGER.debug("Processing source %s", async_redact_data(source, TO_REDACT))
+    return parser.finish(complete=source is not None)
 
-    keymap = generate_keymap(data, key_search)
-    for entry in source:
-        if only and not matches_only(entry, only):
-            continue
 
-        if skip and can_skip(entry, skip):
-            continue
+# ---------------------------
+#   async_parse_api
+# ---------------------------
+async def async_parse_api(source, complete, **kwargs) -> dict | tuple:
+    """Parse rows from an async iterator as they are received.
 
+    complete() is checked once the iterator is exhausted, a stream that
+    ended early is handled like parse_api handles a None source.
+    """
+    parser = RowParser(**kwargs)
+    feed = parser.feed
+    async for entry in source:
+        feed(entry)
+
+    return parser.finish(complete=complete())
+
+
+# ---------------------------
+#   RowParser
+# ---------------------------
+class RowParser:
+    """Incremental parse_api state, fed one API entry at a time."""
+
+    def __init__(
+        self,
+        data=None,
+        key=None,
+        key_secondary=None,
+        key_search=None,
+        vals=None,
+        val_proc=None,
+        ensure_vals=None,
+        only=None,
+        skip=None,
+        track_changes=False,
+        compact=False,
+        path=None,
+        debug_first=DEBUG_SAMPLE_FIRST,
+        debug_every=DEBUG_SAMPLE_EVERY,
+    ):
+        """Compile schema and prepare target table."""
+        self.data = data
+        self.key = key
+        self.key_secondary = key_secondary
+        self.key_search = key_search
+        self.vals = vals
+        self.path = path
+        self.debug_first = debug_first
+        self.debug_every = debug_every
+        self.logger = get_logger(path)
+        self.debug = self.logger.isEnabledFor(DEBUG)
+        self.changes = ParseChanges() if track_changes else None
+        self.count = 0
+        self.seen = set()
+        self.matches_only, self.can_skip, self.fill_entry = compile_schema(
+            vals, ensure_vals, val_proc, only, skip
+        )
+        self.keymap = generate_keymap(data, key_search)
+        self.reindex = data.reindex if isinstance(data, IndexedTable) else None
+        self.row_class = (
+            get_row_class(schema_fields(vals, ensure_vals, val_proc))
+            if compact
+            else dict
+        )
+
+    # ---------------------------
+    #   feed
+    # ---------------------------
+    def feed(self, entry) -> None:
+        """Process a single API entry."""
+        idx = self.count
+        self.count += 1
+        if self.matches_only and not self.matches_only(entry):
+            return
+
+        if self.can_skip and self.can_skip(entry):
+            return
+
+        data = self.data
+        changes = self.changes
         uid = None
-        if key or key_search:
-            uid = get_uid(entry, key, key_secondary, key_search, keymap)
+        if self.key or self.key_search:
+            uid = get_uid(
+                entry, self.key, self.key_secondary, self.key_search, self.keymap
+            )
             if not uid:
-                continue
+                return
 
             if uid not in data:
-                data[uid] = {}
+                data[uid] = self.row_class()
+                if changes:
+                    changes.added.add(uid)
+
+        if self.debug and (
+            idx < self.debug_first or self.debug_every and not idx % self.debug_every
+        ):
+            self.logger.debug("Processing entry %s: %s", idx, Redacted(entry))
+
+        target = data[uid] if uid else data
+        fields = None
+        if changes:
+            self.seen.add(uid)
+            if uid not in changes.added:
+                fields = set()
+
+        self.fill_entry(target, entry, fields)
+        if self.reindex and uid:
+            self.reindex(uid)
+
+        if fields:
+            changes.changed.setdefault(uid, set()).update(fields)
+
+    # ---------------------------
+    #   finish
+    # ---------------------------
+    def finish(self, complete=True) -> dict | tuple:
+        """Return parsed data, and change-set if tracked.
+
+        Rows are only reported removed if the source was complete.
+        """
+        data = self.data
+        changes = self.changes
+        if self.debug:
+            self.logger.debug(
+                "Processed %s entries from %s", self.count, self.path or "source"
+            )
+
+        if not self.count and not self.key and not self.key_search:
+            data = fill_defaults(data, self.vals)
+        elif changes and complete and self.key and not self.key_search:
+            changes.removed.update(data.keys() - self.seen)
+
+        return (data, changes) if changes else data
 
-        if debug:
-            _LOGGER.debug("Processing entry %s", async_redact_data(entry, TO_REDACT))
 
-        if vals:
-            data = fill_vals(data, entry, uid, vals)
+# ---------------------------
+#   get_proplist
+# ---------------------------
+def get_proplist(
+    key=None,
+    key_secondary=None,
+    key_search=None,
+    vals=None,
+    only=None,
+    skip=None,
+    **kwargs,
+) -> Optional(list):
+    """Get API fields used by parse_api, None if all fields are needed."""
+    if not vals:
+        return None
 
-        if ensure_vals:
-            data = fill_ensure_vals(data, uid, ensure_vals)
+    proplist = {key, key_secondary, key_search}
+    for val in vals:
+        proplist.add(val.get("source", val["name"]).split("/")[0])
 
-        if val_proc:
-            data = fill_vals_proc(data, uid, val_proc)
+    for val in only or []:
+        proplist.add(val["key"])
 
-    return data
+    for val in skip or []:
+        proplist.add(val["name"])
+
+    proplist.discard(None)
+    return sorted(proplist)
+
+
+# ---------------------------
+#   schema_fields
+# ---------------------------
+def schema_fields(vals, ensure_vals, val_proc) -> list:
+    """Return names of fields parse_api writes, in write order."""
+    fields = [val["name"] for val in vals or []]
+    fields += [val["name"] for val in ensure_vals or []]
+    for val_sub in val_proc or []:
+        fields += [val["name"] for val in val_sub if "name" in val]
+
+    return fields
 
 
 # ---------------------------
@@ -174,7 +403,11 @@ def get_uid(entry, key, key_secondary, key_search, keymap) -> Optional(str):
 #   generate_keymap
 # ---------------------------
 def generate_keymap(data, key_search) -> Optional(dict):
-    """Generate keymap."""
+    """Generate keymap, indexed tables provide their own."""
+    if isinstance(data, IndexedTable) and key_search:
+        if (keymap := data.keymap(key_search)) is not None:
+            return keymap
+
     return (
         {data[uid][key_search]: uid for uid in data if key_search in data[uid]}
         if key_search
@@ -182,40 +415,6 @@ def generate_keymap(data, key_search) -> Optional(dict):
     )
 
 
-# ---------------------------
-#   matches_only
-# ---------------------------
-def matches_only(entry, only) -> bool:
-    """Return True if all variables are matched."""
-    ret = False
-    for val in only:
-        if val["key"] in entry and entry[val["key"]] == val["value"]:
-            ret = True
-        else:
-            ret = False
-            break
-
-    return ret
-
-
-# ---------------------------
-#   can_skip
-# ---------------------------
-def can_skip(entry, skip) -> bool:
-    """Return True if at least one variable matches."""
-    ret = False
-    for val in skip:
-        if val["name"] in entry and entry[val["name"]] == val["value"]:
-            ret = True
-            break
-
-        if val["value"] == "" and val["name"] not in entry:
-            ret = True
-            break
-
-    return ret
-
-
 # ---------------------------
 #   fill_defaults
 # ---------------------------
@@ -246,108 +445,259 @@ def fill_defaults(data, vals) -> dict:
 
 
 # ---------------------------
-#   fill_vals
+#   freeze_schema
 # ---------------------------
-def fill_vals(data, entry, uid, vals) -> dict:
-    """Fill all data."""
-    for val in vals:
-        _name = val["name"]
-        _type = val["type"] if "type" in val else "str"
-        _source = val["source"] if "source" in val else _name
-        _convert = val["convert"] if "convert" in val else None
+def freeze_schema(schema):
+    """Return hashable copy of a schema, keeping value types apart."""
+    if isinstance(schema, dict):
+        return tuple(sorted((k, freeze_schema(v)) for k, v in schema.items()))
 
-        if _type == "str":
-            _default = val["default"] if "default" in val else ""
-            if "default_val" in val and val["default_val"] in val:
-                _default = val[val["default_val"]]
+    if isinstance(schema, (list, tuple)):
+        return tuple(freeze_schema(v) for v in schema)
 
-            if uid:
-                data[uid][_name] = from_entry(entry, _source, default=_default)
-            else:
-                data[_name] = from_entry(entry, _source, default=_default)
+    # True == 1 == 1.0 must not share a cache entry
+    return type(schema).__name__, schema
 
-        elif _type == "bool":
-            _default = val["default"] if "default" in val else False
-            _reverse = val["reverse"] if "reverse" in val else False
 
-            if uid:
-                data[uid][_name] = from_entry_bool(
-                    entry, _source, default=_default, reverse=_reverse
-                )
-            else:
-                data[_name] = from_entry_bool(
-                    entry, _source, default=_default, reverse=_reverse
-                )
+# ---------------------------
+#   compile_schema
+# ---------------------------
+def compile_schema(vals, ensure_vals, val_proc, only, skip) -> tuple:
+    """Compile schema into (matches_only, can_skip, fill_entry) callables.
 
-        if _convert == "utc_from_timestamp":
-            if uid:
-                if isinstance(data[uid][_name], int) and data[uid][_name] > 0:
-                    if data[uid][_name] > 100000000000:
-                        data[uid][_name] = data[uid][_name] / 1000
+    Schemas are literals rebuilt on every call, so compiled results are
+    cached by schema structure rather than identity. The cache keeps the
+    most recently used schemas, so schemas built from changing values do
+    not accumulate.
+    """
+    cache_key = freeze_schema((vals, ensure_vals, val_proc, only, skip))
+    compiled = _COMPILED_SCHEMAS.pop(cache_key, None)
+    if compiled is None:
+        compiled = (
+            compile_only(only),
+            compile_skip(skip),
+            compile_fill(vals or [], ensure_vals or [], val_proc or []),
+        )
+        if len(_COMPILED_SCHEMAS) >= COMPILED_SCHEMA_CACHE_SIZE:
+            del _COMPILED_SCHEMAS[next(iter(_COMPILED_SCHEMAS))]
 
-                    data[uid][_name] = utc_from_timestamp(data[uid][_name])
-            elif isinstance(data[_name], int) and data[_name] > 0:
-                if data[_name] > 100000000000:
-                    data[_name] = data[_name] / 1000
+    # Reinserted last, the first entry is the least recently used
+    _COMPILED_SCHEMAS[cache_key] = compiled
+    return compiled
 
-                data[_name] = utc_from_timestamp(data[_name])
 
-    return data
+_COMPILED_SCHEMAS = {}
+COMPILED_SCHEMA_CACHE_SIZE = 256
+
+# Value of fields not set on a row, when comparing for change tracking
+MISSING = object()
 
 
 # ---------------------------
-#   fill_ensure_vals
+#   compile_fill
 # ---------------------------
-def fill_ensure_vals(data, uid, ensure_vals) -> dict:
-    """Add required keys which are not available in data."""
-    for val in ensure_vals:
-        if uid:
-            if val["name"] not in data[uid]:
-                _default = val["default"] if "default" in val else ""
-                data[uid][val["name"]] = _default
+def compile_fill(vals, ensure_vals, val_proc):
+    """Return callable filling a single data entry from an API entry."""
+    getters = [compile_val(val) for val in vals]
+    ensures = [(val["name"], val.get("default", "")) for val in ensure_vals]
+    procs = [proc for proc in map(compile_val_proc, val_proc) if proc[0]]
 
-        elif val["name"] not in data:
-            _default = val["default"] if "default" in val else ""
-            data[val["name"]] = _default
+    def fill_entry(target, entry, changed=None) -> None:
+        # Changed field names are collected as they are set, so rows are
+        # not copied to be compared afterwards
+        for name, getter in getters:
+            value = getter(entry)
+            if changed is not None and target.get(name, MISSING) != value:
+                changed.add(name)
 
-    return data
+            target[name] = value
+
+        for name, default in ensures:
+            if name not in target:
+                target[name] = default
+                if changed is not None:
+                    changed.add(name)
+
+        for name, parts in procs:
+            value = None
+            for is_key, part in parts:
+                if is_key:
+                    part = target[part] if part in target else "unknown"
+
+                value = f"{value}{part}" if value else part
+
+            if value:
+                if changed is not None and target.get(name, MISSING) != value:
+                    changed.add(name)
+
+                target[name] = value
+
+    return fill_entry
 
 
 # ---------------------------
-#   fill_vals_proc
+#   compile_only
 # ---------------------------
-def fill_vals_proc(data, uid, vals_proc) -> dict:
-    """Add custom keys."""
-    _data = data[uid] if uid else data
-    for val_sub in vals_proc:
-        _name = None
-        _action = None
-        _value = None
-        for val in val_sub:
-            if "name" in val:
-                _name = val["name"]
-                continue
+def compile_only(only):
+    """Return callable returning True if all variables are matched."""
+    if not only:
+        return None
+
+    checks = [(val["key"], val["value"]) for val in only]
+
+    def matches_only(entry) -> bool:
+        for key, value in checks:
+            if key not in entry or entry[key] != value:
+                return False
+
+        return True
+
+    return matches_only
+
+
+# ---------------------------
+#   compile_skip
+# ---------------------------
+def compile_skip(skip):
+    """Return callable returning True if at least one variable matches."""
+    if not skip:
+        return None
+
+    checks = [(val["name"], val["value"]) for val in skip]
+
+    def can_skip(entry) -> bool:
+        for name, value in checks:
+            if name in entry:
+                if entry[name] == value:
+                    return True
+            elif value == "":
+                return True
+
+        return False
+
+    return can_skip
+
+
+# ---------------------------
+#   compile_val
+# ---------------------------
+def compile_val(val) -> tuple:
+    """Compile single vals entry into name and getter."""
+    name = val["name"]
+    source = val.get("source", name)
+    path = source.split("/") if "/" in source else None
+
+    convert = val.get("convert") == "utc_from_timestamp"
 
-            if "action" in val:
-                _action = val["action"]
-                continue
+    if val.get("type", "str") == "bool":
+        default = val.get("default", False)
+        reverse = val.get("reverse", False)
 
-            if not _name and not _action:
-                break
+        def getter(entry):
+            ret = from_entry_bool(entry, source, default=default, reverse=reverse)
+            return convert_timestamp(ret) if convert else ret
 
-            if _action == "combine":
-                if "key" in val:
-                    tmp = _data[val["key"]] if val["key"] in _data else "unknown"
-                    _value = f"{_value}{tmp}" if _value else tmp
+        return name, getter
 
-                if "text" in val:
-                    tmp = val["text"]
-                    _value = f"{_value}{tmp}" if _value else tmp
+    default = val.get("default", "")
+    if "default_val" in val and val["default_val"] in val:
+        default = val[val["default_val"]]
 
-        if _name and _value:
-            if uid:
-                data[uid][_name] = _value
+    cast = default != ""
+
+    if not path and not cast and not convert:
+
+        def getter(entry):
+            if source not in entry:
+                return default
+
+            ret = entry[source]
+            return ret[:255] if isinstance(ret, str) and len(ret) > 255 else ret
+
+        return name, getter
+
+    def getter(entry):
+        if path:
+            ret = entry
+            for tmp_param in path:
+                if isinstance(ret, dict) and tmp_param in ret:
+                    ret = ret[tmp_param]
+                else:
+                    ret = default
+                    break
             else:
-                data[_name] = _value
+                ret = cast_value(ret) if cast else ret
+        elif source in entry:
+            ret = entry[source]
+            if cast:
+                ret = cast_value(ret)
+        else:
+            ret = default
 
-    return data
+        if isinstance(ret, str) and len(ret) > 255:
+            ret = ret[:255]
+
+        return convert_timestamp(ret) if convert else ret
+
+    return name, getter
+
+
+# ---------------------------
+#   convert_timestamp
+# ---------------------------
+def convert_timestamp(ret):
+    """Convert positive int seconds or milliseconds timestamp to UTC time."""
+    if isinstance(ret, int) and ret > 0:
+        if ret > 100000000000:
+            ret = ret / 1000
+
+        ret = utc_from_timestamp(ret)
+
+    return ret
+
+
+# ---------------------------
+#   cast_value
+# ---------------------------
+def cast_value(ret):
+    """Cast value the way from_entry does for non-empty defaults."""
+    if isinstance(ret, str):
+        return ret
+
+    if isinstance(ret, int):
+        return int(ret)
+
+    if isinstance(ret, float):
+        return round(float(ret), 2)
+
+    return ret
+
+
+# ---------------------------
+#   compile_val_proc
+# ---------------------------
+def compile_val_proc(val_sub) -> tuple:
+    """Compile single val_proc entry into name and combine parts."""
+    _name = None
+    _action = None
+    parts = []
+    for val in val_sub:
+        if "name" in val:
+            _name = val["name"]
+            continue
+
+        if "action" in val:
+            _action = val["action"]
+            continue
+
+        if not _name and not _action:
+            break
+
+        if _action == "combine":
+            if "key" in val:
+                parts.append((True, val["key"]))
+
+            if "text" in val:
+                parts.append((False, val["text"]))
+
+    return _name, parts
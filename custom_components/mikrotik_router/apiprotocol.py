@@ -0,0 +1,355 @@
+"""RouterOS API protocol for Mikrotik Router."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+from binascii import hexlify, unhexlify
+from hashlib import md5
+from logging import getLogger
+
+from .exceptions import ApiConnectionClosed, ApiError, ApiFatalError, ApiTrapError
+
+_LOGGER = getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+TYPE_MAPPING = {"yes": True, "true": True, "no": False, "false": False}
+
+
+# ---------------------------
+#   encode_length
+# ---------------------------
+def encode_length(length) -> bytes:
+    """Encode word length in RouterOS API format."""
+    if length < 0x80:
+        return length.to_bytes(1, "big")
+    if length < 0x4000:
+        return (length | 0x8000).to_bytes(2, "big")
+    if length < 0x200000:
+        return (length | 0xC00000).to_bytes(3, "big")
+    if length < 0x10000000:
+        return (length | 0xE0000000).to_bytes(4, "big")
+
+    return b"\xf0" + length.to_bytes(4, "big")
+
+
+# ---------------------------
+#   encode_sentence
+# ---------------------------
+def encode_sentence(words, encoding) -> bytes:
+    """Encode words into a RouterOS API sentence."""
+    sentence = b""
+    for word in words:
+        word = word.encode(encoding, errors="strict")
+        sentence += encode_length(len(word)) + word
+
+    return sentence + b"\x00"
+
+
+# ---------------------------
+#   cast_to_api
+# ---------------------------
+def cast_to_api(value) -> str:
+    """Cast python value to RouterOS API value."""
+    if value is True:
+        return "yes"
+
+    if value is False:
+        return "no"
+
+    return str(value)
+
+
+# ---------------------------
+#   compose_words
+# ---------------------------
+def compose_words(args) -> list:
+    """Compose attribute words from dict."""
+    return [f"={key}={cast_to_api(value)}" for key, value in args.items()]
+
+
+# ---------------------------
+#   compose_query
+# ---------------------------
+def compose_query(only=None, skip=None) -> list:
+    """Compose query words from parse_api only and skip filters.
+
+    only entries must all match, an entry matching any skip filter is
+    dropped. Filters on values the API cannot compare are left out and
+    must still be applied on received data.
+    """
+    words = []
+    for val in only or []:
+        if isinstance(val["value"], (str, int)):
+            words.append(f"?{val['key']}={cast_to_api(val['value'])}")
+
+    for val in skip or []:
+        if val["value"] == "":
+            # Skip entries without the property or with an empty value
+            words += [f"?{val['name']}", f"?{val['name']}=", "?#!", "?#&"]
+        elif isinstance(val["value"], (str, int)):
+            words += [f"?{val['name']}={cast_to_api(val['value'])}", "?#!"]
+
+    return words
+
+
+# ---------------------------
+#   parse_word
+# ---------------------------
+def parse_word(word) -> tuple:
+    """Parse attribute word into key and python value."""
+    _, key, value = word.split("=", 2)
+    try:
+        ret = int(value)
+        if str(ret) != value:
+            ret = value
+    except ValueError:
+        ret = TYPE_MAPPING.get(value, value)
+
+    return key, ret
+
+
+# ---------------------------
+#   encode_password
+# ---------------------------
+def encode_password(token, password) -> str:
+    """Encode password for pre 6.43 token login."""
+    hasher = md5(usedforsecurity=False)
+    hasher.update(b"\x00" + password.encode("ascii") + unhexlify(token))
+    return "00" + hexlify(hasher.digest()).decode("ascii")
+
+
+# ---------------------------
+#   ApiConnection
+# ---------------------------
+class ApiConnection:
+    """RouterOS API session over asyncio streams.
+
+    Every command is sent with its own .tag word, so any number of commands
+    can be in flight at once. A single reader task demultiplexes replies
+    back to the waiting command by tag.
+    """
+
+    def __init__(self, reader, writer, encoding, timeout=DEFAULT_TIMEOUT):
+        """Initialize the session."""
+        self._reader = reader
+        self._writer = writer
+        self._encoding = encoding
+        self._timeout = timeout
+        self._tag = 0
+        self._pending = {}
+        self._error = None
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+
+    # ---------------------------
+    #   open
+    # ---------------------------
+    @classmethod
+    async def open(
+        cls,
+        host,
+        port,
+        ssl_context: ssl.SSLContext | None = None,
+        encoding="ISO-8859-1",
+        timeout=DEFAULT_TIMEOUT,
+    ) -> ApiConnection:
+        """Open plain or TLS connection to RouterOS API."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl_context), timeout
+        )
+        return cls(reader, writer, encoding, timeout)
+
+    # ---------------------------
+    #   login
+    # ---------------------------
+    async def login(self, username, password, login_method="plain") -> None:
+        """Authenticate session."""
+        if login_method == "token":
+            response = await self.command("/login")
+            token = str(response[0]["ret"])
+            await self.command(
+                "/login",
+                compose_words(
+                    {"name": username, "response": encode_password(token, password)}
+                ),
+            )
+            return
+
+        await self.command(
+            "/login", compose_words({"name": username, "password": password})
+        )
+
+    # ---------------------------
+    #   command
+    # ---------------------------
+    async def command(self, cmd, words=None) -> list:
+        """Send command and return all replies."""
+        return [attrs async for attrs in self.stream(cmd, words)]
+
+    # ---------------------------
+    #   stream
+    # ---------------------------
+    async def stream(self, cmd, words=None):
+        """Send command and yield replies as they are received.
+
+        Closing the iterator early cancels the command on the router.
+        """
+        tag = self._send(cmd, words)
+        trap = None
+        try:
+            while True:
+                reply, attrs = await asyncio.wait_for(
+                    self._pending[tag].get(), self._timeout
+                )
+                if reply == "!error":
+                    raise self._error
+
+                if reply == "!trap":
+                    trap = trap or ApiTrapError(attrs.get("message", "unknown"))
+                elif reply in ("!re", "!done") and attrs:
+                    yield attrs
+
+                if reply == "!done":
+                    break
+        except BaseException:
+            self._cancel(tag)
+            raise
+
+        del self._pending[tag]
+        if trap:
+            raise trap
+
+    # ---------------------------
+    #   _send
+    # ---------------------------
+    def _send(self, cmd, words=None) -> str:
+        """Write tagged sentence and register reply queue."""
+        if self._error:
+            raise self._error
+
+        self._tag += 1
+        tag = str(self._tag)
+        self._pending[tag] = asyncio.Queue()
+        self._writer.write(
+            encode_sentence([cmd, *(words or []), f".tag={tag}"], self._encoding)
+        )
+        return tag
+
+    # ---------------------------
+    #   _cancel
+    # ---------------------------
+    def _cancel(self, tag) -> None:
+        """Abandon command, router is asked to stop it."""
+        if tag not in self._pending:
+            return
+
+        # Remaining replies for this tag are discarded by the reader
+        self._pending[tag] = None
+        if not self._error and not self._writer.is_closing():
+            self._writer.write(
+                encode_sentence(["/cancel", f"=tag={tag}"], self._encoding)
+            )
+
+    # ---------------------------
+    #   _read_loop
+    # ---------------------------
+    async def _read_loop(self) -> None:
+        """Read sentences and dispatch them by tag."""
+        try:
+            while True:
+                reply, attrs = await self._read_sentence()
+                tag = attrs.pop(".tag", None)
+                if tag not in self._pending:
+                    continue
+
+                if self._pending[tag] is None:
+                    if reply == "!done":
+                        del self._pending[tag]
+                    continue
+
+                self._pending[tag].put_nowait((reply, attrs))
+        except Exception as e:
+            self._error = e if isinstance(e, ApiError) else ApiConnectionClosed(f"{e}")
+        except asyncio.CancelledError:
+            self._error = ApiConnectionClosed("connection closed")
+
+        self.close()
+        for queue in self._pending.values():
+            if queue is not None:
+                queue.put_nowait(("!error", {}))
+
+    # ---------------------------
+    #   _read_sentence
+    # ---------------------------
+    async def _read_sentence(self) -> tuple:
+        """Read one sentence and parse its attribute words."""
+        words = []
+        while word := await self._read_word():
+            words.append(word)
+
+        if not words:
+            raise ApiConnectionClosed("empty sentence received")
+
+        reply = words[0]
+        if reply == "!fatal":
+            raise ApiFatalError(words[1] if len(words) > 1 else "fatal error")
+
+        attrs = {}
+        for word in words[1:]:
+            if word.startswith("="):
+                key, value = parse_word(word)
+                attrs[key] = value
+            elif word.startswith(".tag="):
+                attrs[".tag"] = word[5:]
+
+        return reply, attrs
+
+    # ---------------------------
+    #   _read_word
+    # ---------------------------
+    async def _read_word(self) -> str:
+        """Read one length prefixed word."""
+        try:
+            first = (await self._reader.readexactly(1))[0]
+            if first < 0x80:
+                length = first
+            elif first < 0xC0:
+                length = int.from_bytes(
+                    bytes([first]) + await self._reader.readexactly(1), "big"
+                )
+                length ^= 0x8000
+            elif first < 0xE0:
+                length = int.from_bytes(
+                    bytes([first]) + await self._reader.readexactly(2), "big"
+                )
+                length ^= 0xC00000
+            elif first < 0xF0:
+                length = int.from_bytes(
+                    bytes([first]) + await self._reader.readexactly(3), "big"
+                )
+                length ^= 0xE0000000
+            else:
+                length = int.from_bytes(await self._reader.readexactly(4), "big")
+
+            if not length:
+                return ""
+
+            word = await self._reader.readexactly(length)
+        except asyncio.IncompleteReadError as e:
+            raise ApiConnectionClosed("connection closed by router") from e
+
+        return word.decode(self._encoding, errors="ignore")
+
+    # ---------------------------
+    #   close
+    # ---------------------------
+    def close(self) -> None:
+        """Close the session."""
+        if not self._error:
+            self._error = ApiConnectionClosed("connection closed")
+
+        if not self._reader_task.done():
+            self._reader_task.cancel()
+
+        if not self._writer.is_closing():
+            self._writer.close()
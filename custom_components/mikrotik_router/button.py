@@ -57,6 +57,6 @@ class MikrotikScriptButton(MikrotikButton):
     async def async_press(self) -> None:
         """Run script using Mikrotik API"""
         try:
-            self.coordinator.api.run_script(self._data["name"])
+            await self.coordinator.api.run_script(self._data["name"])
         except ApiEntryNotFound as error:
             _LOGGER.error("Failed to run script: %s", error)
@@ -0,0 +1,122 @@
+"""Compact row storage for large Mikrotik Router tables."""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from sys import intern
+
+_ROW_CLASSES = {}
+
+
+# ---------------------------
+#   CompactRow
+# ---------------------------
+class CompactRow(MutableMapping):
+    """Mapping row storing schema fields in slots.
+
+    Fields outside the schema go to a small overflow dict. String values
+    are interned, so repeated values like "unknown" or interface names
+    are stored once.
+    """
+
+    __slots__ = ("_extra",)
+    _slots = {}
+
+    def __getitem__(self, name):
+        """Return field value."""
+        try:
+            if (slot := self._slots.get(name)) is not None:
+                return slot.__get__(self)
+
+            return self._extra[name]
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __setitem__(self, name, value) -> None:
+        """Set field value."""
+        if type(value) is str:
+            value = intern(value)
+
+        if (slot := self._slots.get(name)) is not None:
+            slot.__set__(self, value)
+            return
+
+        try:
+            self._extra[name] = value
+        except AttributeError:
+            self._extra = {name: value}
+
+    def __delitem__(self, name) -> None:
+        """Delete field."""
+        try:
+            if (slot := self._slots.get(name)) is not None:
+                slot.__delete__(self)
+            else:
+                del self._extra[name]
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __contains__(self, name) -> bool:
+        """Return True if field is set."""
+        try:
+            self[name]
+        except KeyError:
+            return False
+
+        return True
+
+    def __iter__(self):
+        """Iterate over set fields in schema order."""
+        for name, slot in self._slots.items():
+            try:
+                slot.__get__(self)
+            except AttributeError:
+                continue
+
+            yield name
+
+        yield from getattr(self, "_extra", ())
+
+    def __len__(self) -> int:
+        """Return number of set fields."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Return row as dict representation."""
+        return repr(dict(self))
+
+    def copy(self) -> dict:
+        """Return shallow dict copy."""
+        return dict(self)
+
+    def __reduce__(self):
+        """Pickle and copy support."""
+        return _restore_row, (tuple(self._slots), dict(self))
+
+
+# ---------------------------
+#   get_row_class
+# ---------------------------
+def get_row_class(fields) -> type:
+    """Return CompactRow class with slots for fields."""
+    fields = tuple(dict.fromkeys(fields))
+    if fields not in _ROW_CLASSES:
+        # Field names are not identifiers, slots are numbered instead
+        slots = tuple(f"_{idx}" for idx in range(len(fields)))
+        row_class = type("CompactRow", (CompactRow,), {"__slots__": slots})
+        row_class._slots = {
+            name: getattr(row_class, slot) for name, slot in zip(fields, slots)
+        }
+        _ROW_CLASSES[fields] = row_class
+
+    return _ROW_CLASSES[fields]
+
+
+# ---------------------------
+#   _restore_row
+# ---------------------------
+def _restore_row(fields, values) -> CompactRow:
+    """Rebuild pickled or copied row."""
+    row = get_row_class(fields)()
+    row.update(values)
+    return row
@@ -27,6 +27,12 @@ from .const import (
     DEFAULT_TRACK_IFACE_CLIENTS,
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL_HOSTS,
+    DEFAULT_SCAN_INTERVAL_HOSTS,
+    CONF_SCAN_INTERVAL_CONFIG,
+    DEFAULT_SCAN_INTERVAL_CONFIG,
+    CONF_SCAN_INTERVAL_SFP,
+    DEFAULT_SCAN_INTERVAL_SFP,
     CONF_TRACK_HOSTS,
     DEFAULT_TRACK_HOSTS,
     CONF_SENSOR_PORT_TRACKER,
@@ -55,6 +61,14 @@ from .const import (
     DEFAULT_SENSOR_ENVIRONMENT,
     CONF_TRACK_HOSTS_TIMEOUT,
     DEFAULT_TRACK_HOST_TIMEOUT,
+    CONF_TRACK_HOSTS_CONCURRENCY,
+    DEFAULT_TRACK_HOSTS_CONCURRENCY,
+    CONF_TRACK_HOSTS_PASSIVE,
+    DEFAULT_TRACK_HOSTS_PASSIVE,
+    CONF_TRACK_HOSTS_PASSIVE_AGE,
+    DEFAULT_TRACK_HOSTS_PASSIVE_AGE,
+    CONF_COMPACT_HOST_TABLES,
+    DEFAULT_COMPACT_HOST_TABLES,
     DEFAULT_HOST,
     DEFAULT_USERNAME,
     DEFAULT_PORT,
@@ -119,9 +133,11 @@ class MikrotikControllerConfigFlow(ConfigFlow, domain=DOMAIN):
                 use_ssl=user_input[CONF_SSL],
                 ssl_verify=user_input[CONF_VERIFY_SSL],
             )
-            if not api.connect():
+            if not await api.connect():
                 errors[CONF_HOST] = api.error
 
+            api.close()
+
             # Save instance
             if not errors:
                 return self.async_create_entry(
@@ -199,6 +215,24 @@ class MikrotikControllerOptionsFlowHandler(OptionsFlow):
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): int,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_HOSTS,
+                        default=self.config_entry.options.get(
+                            CONF_SCAN_INTERVAL_HOSTS, DEFAULT_SCAN_INTERVAL_HOSTS
+                        ),
+                    ): int,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_CONFIG,
+                        default=self.config_entry.options.get(
+                            CONF_SCAN_INTERVAL_CONFIG, DEFAULT_SCAN_INTERVAL_CONFIG
+                        ),
+                    ): int,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_SFP,
+                        default=self.config_entry.options.get(
+                            CONF_SCAN_INTERVAL_SFP, DEFAULT_SCAN_INTERVAL_SFP
+                        ),
+                    ): int,
                     vol.Optional(
                         CONF_TRACK_IFACE_CLIENTS,
                         default=self.config_entry.options.get(
@@ -211,6 +245,32 @@ class MikrotikControllerOptionsFlowHandler(OptionsFlow):
                             CONF_TRACK_HOSTS_TIMEOUT, DEFAULT_TRACK_HOST_TIMEOUT
                         ),
                     ): int,
+                    vol.Optional(
+                        CONF_TRACK_HOSTS_CONCURRENCY,
+                        default=self.config_entry.options.get(
+                            CONF_TRACK_HOSTS_CONCURRENCY,
+                            DEFAULT_TRACK_HOSTS_CONCURRENCY,
+                        ),
+                    ): int,
+                    vol.Optional(
+                        CONF_TRACK_HOSTS_PASSIVE,
+                        default=self.config_entry.options.get(
+                            CONF_TRACK_HOSTS_PASSIVE, DEFAULT_TRACK_HOSTS_PASSIVE
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TRACK_HOSTS_PASSIVE_AGE,
+                        default=self.config_entry.options.get(
+                            CONF_TRACK_HOSTS_PASSIVE_AGE,
+                            DEFAULT_TRACK_HOSTS_PASSIVE_AGE,
+                        ),
+                    ): int,
+                    vol.Optional(
+                        CONF_COMPACT_HOST_TABLES,
+                        default=self.config_entry.options.get(
+                            CONF_COMPACT_HOST_TABLES, DEFAULT_COMPACT_HOST_TABLES
+                        ),
+                    ): bool,
                     vol.Optional(
                         CONF_ZONE,
                         default=self.config_entry.options.get(CONF_ZONE, STATE_HOME),
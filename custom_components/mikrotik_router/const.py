@@ -27,12 +27,26 @@ DEFAULT_VERIFY_SSL = False
 
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 30
+CONF_SCAN_INTERVAL_HOSTS = "scan_interval_hosts"
+DEFAULT_SCAN_INTERVAL_HOSTS = 30
+CONF_SCAN_INTERVAL_CONFIG = "scan_interval_config"
+DEFAULT_SCAN_INTERVAL_CONFIG = 300
+CONF_SCAN_INTERVAL_SFP = "scan_interval_sfp"
+DEFAULT_SCAN_INTERVAL_SFP = 300
 CONF_TRACK_IFACE_CLIENTS = "track_iface_clients"
 DEFAULT_TRACK_IFACE_CLIENTS = True
 CONF_TRACK_HOSTS = "track_network_hosts"
 DEFAULT_TRACK_HOSTS = False
 CONF_TRACK_HOSTS_TIMEOUT = "track_network_hosts_timeout"
 DEFAULT_TRACK_HOST_TIMEOUT = 180
+CONF_TRACK_HOSTS_CONCURRENCY = "track_network_hosts_concurrency"
+DEFAULT_TRACK_HOSTS_CONCURRENCY = 10
+CONF_TRACK_HOSTS_PASSIVE = "track_network_hosts_passive"
+DEFAULT_TRACK_HOSTS_PASSIVE = False
+CONF_TRACK_HOSTS_PASSIVE_AGE = "track_network_hosts_passive_age"
+DEFAULT_TRACK_HOSTS_PASSIVE_AGE = 60
+CONF_COMPACT_HOST_TABLES = "compact_host_tables"
+DEFAULT_COMPACT_HOST_TABLES = False
 
 CONF_SENSOR_PORT_TRACKER = "sensor_port_tracker"
 DEFAULT_SENSOR_PORT_TRACKER = False
@@ -61,6 +75,10 @@ DEFAULT_SENSOR_ENVIRONMENT = False
 CONF_SENSOR_NETWATCH_TRACKER = "sensor_netwatch_tracker"
 DEFAULT_SENSOR_NETWATCH_TRACKER = False
 
+# parse_api debug logs the first rows of a source, then every Nth (0 disables)
+DEBUG_SAMPLE_FIRST = 10
+DEBUG_SAMPLE_EVERY = 100
+
 TO_REDACT = {
     "ip-address",
     "client-ip-address",
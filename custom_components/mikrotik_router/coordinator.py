@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 import re
 import pytz
 
+from contextlib import aclosing
 from datetime import datetime, timedelta
+from time import perf_counter
 from dataclasses import dataclass
-from ipaddress import ip_address, IPv4Network
-from mac_vendor_lookup import AsyncMacLookup
+from operator import itemgetter
+from ipaddress import IPv4Network
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.dt import utcnow
 
@@ -37,8 +41,22 @@ from .const import (
     DEFAULT_TRACK_IFACE_CLIENTS,
     CONF_TRACK_HOSTS,
     DEFAULT_TRACK_HOSTS,
+    CONF_TRACK_HOSTS_CONCURRENCY,
+    DEFAULT_TRACK_HOSTS_CONCURRENCY,
+    CONF_TRACK_HOSTS_PASSIVE,
+    DEFAULT_TRACK_HOSTS_PASSIVE,
+    CONF_TRACK_HOSTS_PASSIVE_AGE,
+    DEFAULT_TRACK_HOSTS_PASSIVE_AGE,
+    CONF_COMPACT_HOST_TABLES,
+    DEFAULT_COMPACT_HOST_TABLES,
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL_HOSTS,
+    DEFAULT_SCAN_INTERVAL_HOSTS,
+    CONF_SCAN_INTERVAL_CONFIG,
+    DEFAULT_SCAN_INTERVAL_CONFIG,
+    CONF_SCAN_INTERVAL_SFP,
+    DEFAULT_SCAN_INTERVAL_SFP,
     CONF_SENSOR_PORT_TRAFFIC,
     DEFAULT_SENSOR_PORT_TRAFFIC,
     CONF_SENSOR_CLIENT_TRAFFIC,
@@ -64,13 +82,57 @@ from .const import (
     CONF_SENSOR_NETWATCH_TRACKER,
     DEFAULT_SENSOR_NETWATCH_TRACKER,
 )
-from .apiparser import parse_api
+from .accounting import aggregate_traffic
+from .apiparser import parse_api, async_parse_api, get_proplist
+from .indexedtable import IndexedTable
+from .macvendor import get_mac_vendor_cache
+from .networks import NetworkClassifier
 from .mikrotikapi import MikrotikAPI
+from .scheduler import Stage, async_run_stages
+from .snapshot import copy_snapshot, dump_snapshot, load_snapshot
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIME_ZONE = None
 
+TIER_HOSTS = "hosts"
+TIER_CONFIG = "config"
+TIER_SFP = "sfp"
+
+# Tracker runs every 10 seconds, pings not done by then roll over
+PING_TIME_BUDGET = 8
+
+# Seconds a host table row may be missing on the router before it is dropped
+STALE_ROW_GRACE = 300
+
+# Warm-start snapshot is saved every this many update cycles and on shutdown
+SNAPSHOT_SAVE_CYCLES = 20
+SNAPSHOT_STORAGE_VERSION = 1
+
+# Source table fields read by process_host, in change tracking input order
+HOST_SOURCE_FIELDS = {
+    "capsman_hosts": ("mac-address", "interface"),
+    "wireless_hosts": (
+        "ap",
+        "mac-address",
+        "interface",
+        "signal-strength",
+        "tx-ccq",
+        "tx-rate",
+        "rx-rate",
+    ),
+    "dhcp": (
+        "enabled",
+        "address",
+        "mac-address",
+        "interface",
+        "comment",
+        "host-name",
+    ),
+    "arp": ("address", "mac-address", "interface"),
+    "hostspot_host": ("authorized", "bypassed"),
+}
+
 
 def is_valid_ip(address):
     try:
@@ -80,6 +142,26 @@ def is_valid_ip(address):
         return False
 
 
+def parse_duration(value) -> int | None:
+    """Convert RouterOS duration like 1d2h3m4s or 01:02:03 to seconds."""
+    if not isinstance(value, str) or not value:
+        return None
+
+    if ":" in value:
+        try:
+            hours, minutes, seconds = value.split(":")
+            return int(hours) * 3600 + int(minutes) * 60 + int(float(seconds))
+        except ValueError:
+            return None
+
+    units = {"w": 604800, "d": 86400, "h": 3600, "m": 60, "s": 1, "ms": 0.001}
+    matches = re.findall(r"(\d+)(ms|w|d|h|m|s)", value)
+    if not matches or "".join(n + u for n, u in matches) != value:
+        return None
+
+    return int(sum(int(num) * units[unit] for num, unit in matches))
+
+
 def utc_from_timestamp(timestamp: float) -> datetime:
     """Return a UTC time from a timestamp."""
     return pytz.utc.localize(datetime.utcfromtimestamp(timestamp))
@@ -124,14 +206,9 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
         self.name = config_entry.data[CONF_NAME]
         self.host = config_entry.data[CONF_HOST]
 
-        self.api = MikrotikAPI(
-            config_entry.data[CONF_HOST],
-            config_entry.data[CONF_USERNAME],
-            config_entry.data[CONF_PASSWORD],
-            config_entry.data[CONF_PORT],
-            config_entry.data[CONF_SSL],
-            config_entry.data[CONF_VERIFY_SSL],
-        )
+        # Pings are pipelined over the session of the main coordinator
+        self.api = coordinator.api
+        self.ping_backlog = set()
 
     # ---------------------------
     #   option_zone
@@ -141,6 +218,114 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
         """Config entry option zones."""
         return self.config_entry.options.get(CONF_ZONE, STATE_HOME)
 
+    # ---------------------------
+    #   option_track_hosts_concurrency
+    # ---------------------------
+    @property
+    def option_track_hosts_concurrency(self):
+        """Config entry option concurrent host pings."""
+        return self.config_entry.options.get(
+            CONF_TRACK_HOSTS_CONCURRENCY, DEFAULT_TRACK_HOSTS_CONCURRENCY
+        )
+
+    # ---------------------------
+    #   option_track_hosts_passive
+    # ---------------------------
+    @property
+    def option_track_hosts_passive(self):
+        """Config entry option to skip pings for recently seen hosts."""
+        return self.config_entry.options.get(
+            CONF_TRACK_HOSTS_PASSIVE, DEFAULT_TRACK_HOSTS_PASSIVE
+        )
+
+    # ---------------------------
+    #   option_track_hosts_passive_age
+    # ---------------------------
+    @property
+    def option_track_hosts_passive_age(self):
+        """Config entry option maximum age of passive evidence."""
+        return self.config_entry.options.get(
+            CONF_TRACK_HOSTS_PASSIVE_AGE, DEFAULT_TRACK_HOSTS_PASSIVE_AGE
+        )
+
+    # ---------------------------
+    #   get_passive_age
+    # ---------------------------
+    def get_passive_age(self, uid) -> int | None:
+        """Return seconds since host was last seen in ARP, bridge or DHCP
+
+        Ages reported by the router are counted from when the host tables
+        were last fetched. ARP status is only reported by RouterOS v7, on
+        v6 hosts are seen through the bridge host and DHCP tables alone.
+        """
+        refreshed = self.coordinator.last_tier_update.get(TIER_HOSTS)
+        if refreshed is None:
+            return None
+
+        ages = []
+        if (
+            uid in self.coordinator.ds["arp"]
+            and self.coordinator.ds["arp"][uid]["status"] == "reachable"
+        ):
+            ages.append(0)
+
+        if uid in self.coordinator.ds["bridge_host"]:
+            ages.append(parse_duration(self.coordinator.ds["bridge_host"][uid]["age"]))
+
+        if (
+            uid in self.coordinator.ds["dhcp"]
+            and self.coordinator.ds["dhcp"][uid]["status"] == "bound"
+        ):
+            ages.append(parse_duration(self.coordinator.ds["dhcp"][uid]["last-seen"]))
+
+        ages = [age for age in ages if age is not None]
+        if not ages:
+            return None
+
+        return min(ages) + int((datetime.now() - refreshed).total_seconds())
+
+    # ---------------------------
+    #   async_ping_hosts
+    # ---------------------------
+    async def async_ping_hosts(self, probes) -> None:
+        """Ping hosts concurrently within the cycle time budget"""
+        # Hosts left over from the previous cycle go first
+        probes.sort(key=lambda uid: uid not in self.ping_backlog)
+        semaphore = asyncio.Semaphore(max(1, self.option_track_hosts_concurrency))
+
+        async def _async_ping(uid):
+            async with semaphore:
+                host = self.coordinator.ds["host"][uid]
+                tmp_interface = host["interface"]
+                if (
+                    uid in self.coordinator.ds["arp"]
+                    and self.coordinator.ds["arp"][uid]["bridge"] != ""
+                ):
+                    tmp_interface = self.coordinator.ds["arp"][uid]["bridge"]
+
+                _LOGGER.debug("Ping host: %s", host["address"])
+                host["available"] = await self.api.arp_ping(
+                    host["address"], tmp_interface
+                )
+
+        tasks = {uid: asyncio.create_task(_async_ping(uid)) for uid in probes}
+        if not tasks:
+            self.ping_backlog = set()
+            return
+
+        _, pending = await asyncio.wait(tasks.values(), timeout=PING_TIME_BUDGET)
+        for task in pending:
+            task.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+        self.ping_backlog = {uid for uid, task in tasks.items() if task in pending}
+        if self.ping_backlog:
+            _LOGGER.debug(
+                "Mikrotik %s ping time budget exceeded, %s hosts deferred",
+                self.host,
+                len(self.ping_backlog),
+            )
+
     # ---------------------------
     #   _async_update_data
     # ---------------------------
@@ -152,6 +337,11 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
         if "test" not in self.coordinator.ds["access"]:
             return
 
+        # Keep restored hosts until the router has been reached
+        if self.coordinator.warm_start:
+            return self.data
+
+        probes = []
         for uid in list(self.coordinator.ds["host"]):
             if not self.coordinator.host_tracking_initialized:
                 # Add missing default values
@@ -176,27 +366,20 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
                 and self.coordinator.ds["host"][uid]["address"] not in ["unknown", ""]
                 and self.coordinator.ds["host"][uid]["interface"] not in ["unknown", ""]
             ):
-                tmp_interface = self.coordinator.ds["host"][uid]["interface"]
-                if (
-                    uid in self.coordinator.ds["arp"]
-                    and self.coordinator.ds["arp"][uid]["bridge"] != ""
-                ):
-                    tmp_interface = self.coordinator.ds["arp"][uid]["bridge"]
+                # Router tables already prove the host is alive
+                if self.option_track_hosts_passive:
+                    age = self.get_passive_age(uid)
+                    if age is not None and age <= self.option_track_hosts_passive_age:
+                        self.coordinator.ds["host"][uid]["available"] = True
+                        continue
 
-                _LOGGER.debug(
-                    "Ping host: %s", self.coordinator.ds["host"][uid]["address"]
-                )
+                probes.append(uid)
 
-                self.coordinator.ds["host"][uid]["available"] = (
-                    await self.hass.async_add_executor_job(
-                        self.api.arp_ping,
-                        self.coordinator.ds["host"][uid]["address"],
-                        tmp_interface,
-                    )
-                )
+        await self.async_ping_hosts(probes)
 
-            # Update last seen
-            if self.coordinator.ds["host"][uid]["available"]:
+        # Update last seen
+        for uid in list(self.coordinator.ds["host"]):
+            if self.coordinator.ds["host"][uid].get("available"):
                 self.coordinator.ds["host"][uid]["last-seen"] = utcnow()
 
         self.coordinator.host_tracking_initialized = True
@@ -233,16 +416,16 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             "resource": {},
             "health": {},
             "health7": {},
-            "interface": {},
+            "interface": IndexedTable(indexes=("name",)),
             "bonding": {},
             "bonding_slaves": {},
             "bridge": {},
             "bridge_host": {},
-            "arp": {},
-            "nat": {},
+            "arp": IndexedTable(indexes=("interface",)),
+            "nat": IndexedTable(indexes=("uniq-id",)),
             "kid-control": {},
-            "mangle": {},
-            "filter": {},
+            "mangle": IndexedTable(indexes=("uniq-id",)),
+            "filter": IndexedTable(indexes=("uniq-id",)),
             "ppp_secret": {},
             "ppp_active": {},
             "fw-update": {},
@@ -259,7 +442,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             "host": {},
             "host_hass": {},
             "hostspot_host": {},
-            "client_traffic": {},
+            "client_traffic": IndexedTable(indexes=("address",)),
             "environment": {},
             "ups": {},
             "gps": {},
@@ -285,6 +468,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         self.mangle_removed = {}
         self.filter_removed = {}
         self.host_hass_recovered = False
+        self.host_lock = asyncio.Lock()
+        self.host_inputs = {}
+        self.host_dirty = set()
         self.host_tracking_initialized = False
 
         self.support_capsman = False
@@ -297,12 +483,24 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         self.major_fw_version = 0
         self.minor_fw_version = 0
 
-        self.async_mac_lookup = AsyncMacLookup()
+        self.mac_vendors = get_mac_vendor_cache(hass)
         self.accessrights_reported = False
 
         self.last_hwinfo_update = datetime(1970, 1, 1)
+        self.last_tier_update = {}
+        self.stale_rows = {}
+        self.local_networks = NetworkClassifier()
+        self.dns_host_names = {}
         self.rebootcheck = 0
 
+        self.snapshot_store = Store(
+            hass,
+            SNAPSHOT_STORAGE_VERSION,
+            f"{DOMAIN}.{config_entry.entry_id}.snapshot",
+        )
+        self.snapshot_cycles = 0
+        self.warm_start = False
+
     # ---------------------------
     #   option_track_iface_clients
     # ---------------------------
@@ -321,6 +519,16 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Config entry option to not track ARP."""
         return self.config_entry.options.get(CONF_TRACK_HOSTS, DEFAULT_TRACK_HOSTS)
 
+    # ---------------------------
+    #   option_compact_host_tables
+    # ---------------------------
+    @property
+    def option_compact_host_tables(self):
+        """Config entry option to store ARP, bridge and DHCP rows compactly."""
+        return self.config_entry.options.get(
+            CONF_COMPACT_HOST_TABLES, DEFAULT_COMPACT_HOST_TABLES
+        )
+
     # ---------------------------
     #   option_sensor_port_traffic
     # ---------------------------
@@ -444,6 +652,79 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
         return timedelta(seconds=scan_interval)
 
+    # ---------------------------
+    #   option_scan_interval_hosts
+    # ---------------------------
+    @property
+    def option_scan_interval_hosts(self):
+        """Config entry option host tracking scan interval."""
+        scan_interval = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL_HOSTS, DEFAULT_SCAN_INTERVAL_HOSTS
+        )
+        return timedelta(seconds=scan_interval)
+
+    # ---------------------------
+    #   option_scan_interval_config
+    # ---------------------------
+    @property
+    def option_scan_interval_config(self):
+        """Config entry option configuration scan interval."""
+        scan_interval = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL_CONFIG, DEFAULT_SCAN_INTERVAL_CONFIG
+        )
+        return timedelta(seconds=scan_interval)
+
+    # ---------------------------
+    #   option_scan_interval_sfp
+    # ---------------------------
+    @property
+    def option_scan_interval_sfp(self):
+        """Config entry option SFP diagnostics scan interval."""
+        scan_interval = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL_SFP, DEFAULT_SCAN_INTERVAL_SFP
+        )
+        return timedelta(seconds=scan_interval)
+
+    # ---------------------------
+    #   async_shutdown
+    # ---------------------------
+    async def async_shutdown(self) -> None:
+        """Close API connection on shutdown."""
+        await super().async_shutdown()
+        self.api.close()
+        await self.async_save_snapshot()
+
+    # ---------------------------
+    #   async_save_snapshot
+    # ---------------------------
+    async def async_save_snapshot(self, _event=None) -> None:
+        """Save warm-start snapshot once live data was received"""
+        if not self.snapshot_cycles:
+            return
+
+        # Only the copy blocks the event loop, encoding runs in the executor
+        tables = copy_snapshot(self.ds)
+        await self.snapshot_store.async_save(
+            {
+                "host": self.host,
+                "ds": await self.hass.async_add_executor_job(dump_snapshot, tables),
+            }
+        )
+
+    # ---------------------------
+    #   async_load_snapshot
+    # ---------------------------
+    async def async_load_snapshot(self) -> bool:
+        """Restore data store from the warm-start snapshot"""
+        snapshot = await self.snapshot_store.async_load()
+        if not snapshot or snapshot["host"] != self.host:
+            return False
+
+        await self.hass.async_add_executor_job(load_snapshot, self.ds, snapshot["ds"])
+        self.warm_start = True
+        _LOGGER.debug("Mikrotik %s restored data from snapshot", self.host)
+        return True
+
     # ---------------------------
     #   connected
     # ---------------------------
@@ -452,27 +733,101 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         return self.api.connected()
 
     # ---------------------------
-    #   set_value
+    #   async_set_value
     # ---------------------------
-    def set_value(self, path, param, value, mod_param, mod_value):
+    async def async_set_value(self, path, param, value, mod_param, mod_value):
         """Change value using Mikrotik API"""
-        return self.api.set_value(path, param, value, mod_param, mod_value)
+        self.last_tier_update = {}
+        return await self.api.set_value(path, param, value, mod_param, mod_value)
 
     # ---------------------------
-    #   execute
+    #   async_execute
     # ---------------------------
-    def execute(self, path, command, param, value, attributes=None):
+    async def async_execute(self, path, command, param, value, attributes=None):
         """Change value using Mikrotik API"""
-        return self.api.execute(path, command, param, value, attributes)
+        self.last_tier_update = {}
+        return await self.api.execute(path, command, param, value, attributes)
+
+    # ---------------------------
+    #   async_query_parse
+    # ---------------------------
+    async def async_query_parse(self, path, command=None, args=None, **kwargs):
+        """Query only the fields and rows the parse_api schema consumes
+
+        Print queries are parsed while rows are still being received.
+        """
+        if not command:
+            errors = []
+            async with aclosing(
+                self.api.query_stream(
+                    path,
+                    proplist=get_proplist(**kwargs),
+                    only=kwargs.get("only"),
+                    skip=kwargs.get("skip"),
+                    errors=errors,
+                )
+            ) as source:
+                # Rows missing from an interrupted stream are not removed
+                return await async_parse_api(
+                    source,
+                    lambda: self.api.connected() and not errors,
+                    path=path,
+                    **kwargs,
+                )
+
+        source = await self.api.query(
+            path,
+            command,
+            args,
+            proplist=get_proplist(**kwargs),
+            only=kwargs.get("only"),
+            skip=kwargs.get("skip"),
+        )
+        return parse_api(source=source, path=path, **kwargs)
+
+    # ---------------------------
+    #   evict_stale_rows
+    # ---------------------------
+    def evict_stale_rows(self, name, changes, grace=STALE_ROW_GRACE) -> None:
+        """Drop rows missing on the router for longer than grace seconds"""
+        now = datetime.now()
+        missing = self.stale_rows.setdefault(name, {})
+        for uid in missing.keys() - changes.removed:
+            del missing[uid]
+
+        for uid in changes.removed:
+            if (now - missing.setdefault(uid, now)).total_seconds() >= grace:
+                del self.ds[name][uid]
+                del missing[uid]
 
     # ---------------------------
-    #   get_capabilities
+    #   get_due_tiers
     # ---------------------------
-    def get_capabilities(self):
+    def get_due_tiers(self) -> set:
+        """Return polling tiers due for refresh on this cycle"""
+        now = datetime.now()
+        # Allow for jitter, a tier becomes due on the tick closest to its interval
+        tolerance = self.option_scan_interval / 2
+        due = set()
+        for tier, interval in (
+            (TIER_HOSTS, self.option_scan_interval_hosts),
+            (TIER_CONFIG, self.option_scan_interval_config),
+            (TIER_SFP, self.option_scan_interval_sfp),
+        ):
+            last = self.last_tier_update.get(tier, datetime(1970, 1, 1))
+            if now - last + tolerance >= interval:
+                due.add(tier)
+
+        return due
+
+    # ---------------------------
+    #   async_get_capabilities
+    # ---------------------------
+    async def async_get_capabilities(self):
         """Update Mikrotik data"""
-        packages = parse_api(
+        packages = await self.async_query_parse(
+            "/system/package",
             data={},
-            source=self.api.query("/system/package"),
             key="name",
             vals=[
                 {"name": "name"},
@@ -567,28 +922,50 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Update Mikrotik data"""
         delta = datetime.now().replace(microsecond=0) - self.last_hwinfo_update
         if self.api.has_reconnected() or delta.total_seconds() > 60 * 60 * 4:
-            await self.hass.async_add_executor_job(self.get_access)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_firmware_update)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_system_resource)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_capabilities)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_system_routerboard)
-
-            if self.api.connected() and self.option_sensor_scripts:
-                await self.hass.async_add_executor_job(self.get_script)
+            self.last_tier_update = {}
+            await self.async_get_access()
 
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_dhcp_network)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_dns)
+            await async_run_stages(
+                [
+                    Stage(
+                        "firmware_update",
+                        self.async_get_firmware_update,
+                        reads=("access",),
+                        writes=("fw-update",),
+                    ),
+                    Stage(
+                        "system_resource",
+                        self.async_get_system_resource,
+                        writes=("resource", "fw-update"),
+                    ),
+                    # Package support depends on the firmware version
+                    Stage(
+                        "capabilities",
+                        self.async_get_capabilities,
+                        reads=("fw-update",),
+                        writes=("capabilities",),
+                    ),
+                    Stage(
+                        "system_routerboard",
+                        self.async_get_system_routerboard,
+                        reads=("access", "resource"),
+                        writes=("routerboard",),
+                    ),
+                    Stage(
+                        "script",
+                        self.async_get_script,
+                        writes=("script",),
+                        enabled=self.option_sensor_scripts,
+                    ),
+                    Stage(
+                        "dhcp_network",
+                        self.async_get_dhcp_network,
+                        writes=("dhcp-network",),
+                    ),
+                    Stage("dns", self.async_get_dns, writes=("dns",)),
+                ],
+                self.api.connected,
+            )
 
             if not self.api.connected():
                 raise UpdateFailed("Mikrotik Disconnected")
@@ -596,115 +973,248 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             if self.api.connected():
                 self.last_hwinfo_update = datetime.now().replace(microsecond=0)
 
-        await self.hass.async_add_executor_job(self.get_system_resource)
+        # Also (re)connects, everything below is skipped while disconnected
+        await self.async_get_system_resource()
 
         # if self.api.connected() and "available" not in self.ds["fw-update"]:
-        #     await self.hass.async_add_executor_job(self.get_firmware_update)
-
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_system_health)
-
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_dhcp_client)
-
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_interface)
-
-        if self.api.connected() and not self.ds["host_hass"]:
-            await self.async_get_host_hass()
-
-        if self.api.connected() and self.support_capsman:
-            await self.hass.async_add_executor_job(self.get_capsman_hosts)
-
-        if self.api.connected() and self.support_wireless:
-            await self.hass.async_add_executor_job(self.get_wireless)
-
-        if self.api.connected() and self.support_wireless:
-            await self.hass.async_add_executor_job(self.get_wireless_hosts)
-
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_bridge)
-
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_arp)
-
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_dhcp)
-
-        if self.api.connected():
-            await self.async_process_host()
-
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.process_interface_client)
-
-        if self.api.connected() and self.option_sensor_nat:
-            await self.hass.async_add_executor_job(self.get_nat)
-
-        if self.api.connected() and self.option_sensor_kidcontrol:
-            await self.hass.async_add_executor_job(self.get_kidcontrol)
-
-        if self.api.connected() and self.option_sensor_mangle:
-            await self.hass.async_add_executor_job(self.get_mangle)
-
-        if self.api.connected() and self.option_sensor_filter:
-            await self.hass.async_add_executor_job(self.get_filter)
-
-        if self.api.connected() and self.option_sensor_netwatch:
-            await self.hass.async_add_executor_job(self.get_netwatch)
-
-        if self.api.connected() and self.support_ppp and self.option_sensor_ppp:
-            await self.hass.async_add_executor_job(self.get_ppp)
+        #     await self.async_get_firmware_update()
 
-        if self.api.connected() and self.option_sensor_client_traffic:
-            if 0 < self.major_fw_version < 7:
-                await self.hass.async_add_executor_job(self.process_accounting)
-            elif 0 < self.major_fw_version >= 7:
-                await self.hass.async_add_executor_job(self.process_kid_control_devices)
-
-        if self.api.connected() and self.option_sensor_client_captive:
-            await self.hass.async_add_executor_job(self.get_captive)
-
-        if self.api.connected() and self.option_sensor_simple_queues:
-            await self.hass.async_add_executor_job(self.get_queue)
-
-        if self.api.connected() and self.option_sensor_environment:
-            await self.hass.async_add_executor_job(self.get_environment)
-
-        if self.api.connected() and self.support_ups:
-            await self.hass.async_add_executor_job(self.get_ups)
-
-        if self.api.connected() and self.support_gps:
-            await self.hass.async_add_executor_job(self.get_gps)
+        cycle_start = datetime.now()
+        tiers = self.get_due_tiers()
+        client_traffic = None
+        if 0 < self.major_fw_version < 7:
+            client_traffic = self.async_process_accounting
+        elif 0 < self.major_fw_version >= 7:
+            client_traffic = self.async_process_kid_control_devices
+
+        await async_run_stages(
+            [
+                Stage(
+                    "system_health",
+                    self.async_get_system_health,
+                    reads=("access", "fw-update"),
+                    writes=("health", "health7"),
+                ),
+                Stage(
+                    "dhcp_client",
+                    self.async_get_dhcp_client,
+                    writes=("dhcp-client",),
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "interface",
+                    self.async_get_interface,
+                    writes=("interface", "bonding", "bonding_slaves"),
+                ),
+                Stage(
+                    "interface_sfp",
+                    self.async_get_interface_sfp,
+                    reads=("interface",),
+                    writes=("interface",),
+                    tier=TIER_SFP,
+                ),
+                Stage(
+                    "host_hass",
+                    self.async_get_host_hass,
+                    writes=("host_hass",),
+                    enabled=not self.ds["host_hass"],
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "capsman_hosts",
+                    self.async_get_capsman_hosts,
+                    writes=("capsman_hosts",),
+                    enabled=self.support_capsman,
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "wireless",
+                    self.async_get_wireless,
+                    reads=("interface",),
+                    writes=("wireless", "interface"),
+                    enabled=self.support_wireless,
+                ),
+                Stage(
+                    "wireless_hosts",
+                    self.async_get_wireless_hosts,
+                    writes=("wireless_hosts",),
+                    enabled=self.support_wireless,
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "bridge",
+                    self.async_get_bridge,
+                    writes=("bridge", "bridge_host"),
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "arp",
+                    self.async_get_arp,
+                    reads=("bridge", "bridge_host", "dhcp-client"),
+                    writes=("arp",),
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "dhcp",
+                    self.async_get_dhcp,
+                    reads=("arp",),
+                    writes=("dhcp", "dhcp-server"),
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "process_host",
+                    self.async_process_host,
+                    reads=(
+                        "arp",
+                        "capsman_hosts",
+                        "dhcp",
+                        "dns",
+                        "host_hass",
+                        "hostspot_host",
+                        "resource",
+                        "wireless_hosts",
+                    ),
+                    writes=("host",),
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "interface_client",
+                    lambda: self.hass.async_add_executor_job(
+                        self.process_interface_client
+                    ),
+                    reads=("arp", "bonding_slaves", "dhcp-client"),
+                    writes=("interface",),
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "nat",
+                    self.async_get_nat,
+                    writes=("nat",),
+                    enabled=self.option_sensor_nat,
+                    tier=TIER_CONFIG,
+                ),
+                Stage(
+                    "kidcontrol",
+                    self.async_get_kidcontrol,
+                    writes=("kid-control",),
+                    enabled=self.option_sensor_kidcontrol,
+                    tier=TIER_CONFIG,
+                ),
+                Stage(
+                    "mangle",
+                    self.async_get_mangle,
+                    writes=("mangle",),
+                    enabled=self.option_sensor_mangle,
+                    tier=TIER_CONFIG,
+                ),
+                Stage(
+                    "filter",
+                    self.async_get_filter,
+                    writes=("filter",),
+                    enabled=self.option_sensor_filter,
+                    tier=TIER_CONFIG,
+                ),
+                Stage(
+                    "netwatch",
+                    self.async_get_netwatch,
+                    writes=("netwatch",),
+                    enabled=self.option_sensor_netwatch,
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "ppp",
+                    self.async_get_ppp,
+                    writes=("ppp_secret", "ppp_active"),
+                    enabled=self.support_ppp and self.option_sensor_ppp,
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "client_traffic",
+                    client_traffic,
+                    reads=("host", "interface", "dhcp-network"),
+                    writes=("client_traffic",),
+                    enabled=self.option_sensor_client_traffic
+                    and client_traffic is not None,
+                ),
+                Stage(
+                    "captive",
+                    self.async_get_captive,
+                    reads=("resource",),
+                    writes=("hostspot_host", "resource"),
+                    enabled=self.option_sensor_client_captive,
+                    tier=TIER_HOSTS,
+                ),
+                Stage(
+                    "queue",
+                    self.async_get_queue,
+                    writes=("queue",),
+                    enabled=self.option_sensor_simple_queues,
+                    tier=TIER_CONFIG,
+                ),
+                Stage(
+                    "environment",
+                    self.async_get_environment,
+                    writes=("environment",),
+                    enabled=self.option_sensor_environment,
+                    tier=TIER_CONFIG,
+                ),
+                Stage(
+                    "ups",
+                    self.async_get_ups,
+                    writes=("ups",),
+                    enabled=self.support_ups,
+                ),
+                Stage(
+                    "gps",
+                    self.async_get_gps,
+                    writes=("gps",),
+                    enabled=self.support_gps,
+                ),
+            ],
+            self.api.connected,
+            tiers,
+        )
 
         if not self.api.connected():
             raise UpdateFailed("Mikrotik Disconnected")
 
+        for tier in tiers:
+            self.last_tier_update[tier] = cycle_start
+
+        self.warm_start = False
+        self.snapshot_cycles += 1
+        if self.snapshot_cycles % SNAPSHOT_SAVE_CYCLES == 1:
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_save_snapshot(), f"{DOMAIN} {self.host} snapshot"
+            )
+
         # async_dispatcher_send(self.hass, "update_sensors", self)
         return self.ds
 
     # ---------------------------
-    #   get_access
+    #   async_get_access
     # ---------------------------
-    def get_access(self) -> None:
+    async def async_get_access(self) -> None:
         """Get access rights from Mikrotik"""
-        tmp_user = parse_api(
-            data={},
-            source=self.api.query("/user"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "group"},
-            ],
-        )
-
-        tmp_group = parse_api(
-            data={},
-            source=self.api.query("/user/group"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "policy"},
-            ],
+        tmp_user, tmp_group = await asyncio.gather(
+            self.async_query_parse(
+                "/user",
+                data={},
+                key="name",
+                vals=[
+                    {"name": "name"},
+                    {"name": "group"},
+                ],
+            ),
+            self.async_query_parse(
+                "/user/group",
+                data={},
+                key="name",
+                vals=[
+                    {"name": "name"},
+                    {"name": "policy"},
+                ],
+            ),
         )
 
         if tmp_user[self.config_entry.data[CONF_USERNAME]]["group"] in tmp_group:
@@ -727,13 +1237,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 )
 
     # ---------------------------
-    #   get_interface
+    #   async_get_interface
     # ---------------------------
-    def get_interface(self) -> None:
+    async def async_get_interface(self) -> None:
         """Get all interfaces data from Mikrotik"""
-        self.ds["interface"] = parse_api(
+        self.ds["interface"] = await self.async_query_parse(
+            "/interface",
             data=self.ds["interface"],
-            source=self.api.query("/interface"),
             key="default-name",
             key_secondary="name",
             vals=[
@@ -803,9 +1313,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["interface"][uid]["tx-total"] = current_tx
                 self.ds["interface"][uid]["rx-total"] = current_rx
 
-        self.ds["interface"] = parse_api(
+        self.ds["interface"] = await self.async_query_parse(
+            "/interface/ethernet",
             data=self.ds["interface"],
-            source=self.api.query("/interface/ethernet"),
             key="default-name",
             key_secondary="name",
             vals=[
@@ -827,6 +1337,8 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
         # Udpate virtual interfaces
         bonding = False
+        monitor_ids = []
+        monitor_sfp = set()
         for uid, vals in self.ds["interface"].items():
             if self.ds["interface"][uid]["type"] == "bond":
                 bonding = True
@@ -842,62 +1354,62 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 ] = f"{vals['port-mac-address']}-{vals['name']}"
 
             if self.ds["interface"][uid]["type"] == "ether":
-                if (
-                    "sfp-shutdown-temperature" in vals
-                    and vals["sfp-shutdown-temperature"] != ""
-                ):
-                    self.ds["interface"] = parse_api(
-                        data=self.ds["interface"],
-                        source=self.api.query(
-                            "/interface/ethernet",
-                            command="monitor",
-                            args={".id": vals[".id"], "once": True},
-                        ),
-                        key_search="name",
-                        vals=[
-                            {"name": "status", "default": "unknown"},
-                            {"name": "auto-negotiation", "default": "unknown"},
-                            {"name": "advertising", "default": "unknown"},
-                            {"name": "link-partner-advertising", "default": "unknown"},
-                            {"name": "sfp-temperature", "default": 0},
-                            {"name": "sfp-supply-voltage", "default": "unknown"},
-                            {"name": "sfp-module-present", "default": "unknown"},
-                            {"name": "sfp-tx-bias-current", "default": "unknown"},
-                            {"name": "sfp-tx-power", "default": "unknown"},
-                            {"name": "sfp-rx-power", "default": "unknown"},
-                            {"name": "sfp-rx-loss", "default": "unknown"},
-                            {"name": "sfp-tx-fault", "default": "unknown"},
-                            {"name": "sfp-type", "default": "unknown"},
-                            {"name": "sfp-connector-type", "default": "unknown"},
-                            {"name": "sfp-vendor-name", "default": "unknown"},
-                            {"name": "sfp-vendor-part-number", "default": "unknown"},
-                            {"name": "sfp-vendor-revision", "default": "unknown"},
-                            {"name": "sfp-vendor-serial", "default": "unknown"},
-                            {"name": "sfp-manufacturing-date", "default": "unknown"},
-                            {"name": "eeprom-checksum", "default": "unknown"},
-                        ],
-                    )
-                else:
-                    self.ds["interface"] = parse_api(
-                        data=self.ds["interface"],
-                        source=self.api.query(
-                            "/interface/ethernet",
-                            command="monitor",
-                            args={".id": vals[".id"], "once": True},
+                monitor_ids.append(vals[".id"])
+                if self.is_sfp_interface(vals):
+                    monitor_sfp.add(vals["name"])
+
+        sfp_vals = [
+            {"name": "status", "default": "unknown"},
+            {"name": "auto-negotiation", "default": "unknown"},
+            {"name": "advertising", "default": "unknown"},
+            {"name": "link-partner-advertising", "default": "unknown"},
+        ]
+        port_vals = [
+            {"name": "status", "default": "unknown"},
+            {"name": "rate", "default": "unknown"},
+            {"name": "full-duplex", "default": "unknown"},
+            {"name": "auto-negotiation", "default": "unknown"},
+        ]
+
+        # Monitor all ethernet ports with a single call, SFP diagnostics
+        # are left to the SFP tier
+        monitor = []
+        if monitor_ids:
+            monitor = (
+                await self.api.query(
+                    "/interface/ethernet",
+                    command="monitor",
+                    args={
+                        "numbers": ",".join(monitor_ids),
+                        "once": True,
+                        ".proplist": ",".join(
+                            get_proplist(key_search="name", vals=sfp_vals + port_vals)
                         ),
-                        key_search="name",
-                        vals=[
-                            {"name": "status", "default": "unknown"},
-                            {"name": "rate", "default": "unknown"},
-                            {"name": "full-duplex", "default": "unknown"},
-                            {"name": "auto-negotiation", "default": "unknown"},
-                        ],
-                    )
+                    },
+                )
+                or []
+            )
+
+        self.ds["interface"] = parse_api(
+            data=self.ds["interface"],
+            source=[entry for entry in monitor if entry.get("name") in monitor_sfp],
+            key_search="name",
+            path="/interface/ethernet/monitor",
+            vals=sfp_vals,
+        )
+
+        self.ds["interface"] = parse_api(
+            data=self.ds["interface"],
+            source=[entry for entry in monitor if entry.get("name") not in monitor_sfp],
+            key_search="name",
+            path="/interface/ethernet/monitor",
+            vals=port_vals,
+        )
 
         if bonding:
-            self.ds["bonding"] = parse_api(
+            self.ds["bonding"] = await self.async_query_parse(
+                "/interface/bonding",
                 data={},
-                source=self.api.query("/interface/bonding"),
                 key="name",
                 vals=[
                     {"name": "name"},
@@ -914,18 +1426,69 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     self.ds["bonding_slaves"][tmp]["master"] = uid
 
     # ---------------------------
-    #   get_bridge
+    #   is_sfp_interface
+    # ---------------------------
+    @staticmethod
+    def is_sfp_interface(vals) -> bool:
+        """Return True for ethernet ports with SFP diagnostics"""
+        return (
+            "sfp-shutdown-temperature" in vals
+            and vals["sfp-shutdown-temperature"] != ""
+        )
+
+    # ---------------------------
+    #   async_get_interface_sfp
+    # ---------------------------
+    async def async_get_interface_sfp(self) -> None:
+        """Get SFP module diagnostics from Mikrotik"""
+        monitor_ids = [
+            vals[".id"]
+            for vals in self.ds["interface"].values()
+            if vals["type"] == "ether" and self.is_sfp_interface(vals)
+        ]
+        if not monitor_ids:
+            return
+
+        self.ds["interface"] = await self.async_query_parse(
+            "/interface/ethernet",
+            command="monitor",
+            args={"numbers": ",".join(monitor_ids), "once": True},
+            data=self.ds["interface"],
+            key_search="name",
+            vals=[
+                {"name": "sfp-temperature", "default": 0},
+                {"name": "sfp-supply-voltage", "default": "unknown"},
+                {"name": "sfp-module-present", "default": "unknown"},
+                {"name": "sfp-tx-bias-current", "default": "unknown"},
+                {"name": "sfp-tx-power", "default": "unknown"},
+                {"name": "sfp-rx-power", "default": "unknown"},
+                {"name": "sfp-rx-loss", "default": "unknown"},
+                {"name": "sfp-tx-fault", "default": "unknown"},
+                {"name": "sfp-type", "default": "unknown"},
+                {"name": "sfp-connector-type", "default": "unknown"},
+                {"name": "sfp-vendor-name", "default": "unknown"},
+                {"name": "sfp-vendor-part-number", "default": "unknown"},
+                {"name": "sfp-vendor-revision", "default": "unknown"},
+                {"name": "sfp-vendor-serial", "default": "unknown"},
+                {"name": "sfp-manufacturing-date", "default": "unknown"},
+                {"name": "eeprom-checksum", "default": "unknown"},
+            ],
+        )
+
+    # ---------------------------
+    #   async_get_bridge
     # ---------------------------
-    def get_bridge(self) -> None:
+    async def async_get_bridge(self) -> None:
         """Get system resources data from Mikrotik"""
-        self.ds["bridge_host"] = parse_api(
+        self.ds["bridge_host"], changes = await self.async_query_parse(
+            "/interface/bridge/host",
             data=self.ds["bridge_host"],
-            source=self.api.query("/interface/bridge/host"),
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
                 {"name": "interface", "default": "unknown"},
                 {"name": "bridge", "default": "unknown"},
+                {"name": "age", "default": ""},
                 {
                     "name": "enabled",
                     "source": "disabled",
@@ -934,7 +1497,10 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 },
             ],
             only=[{"key": "local", "value": False}],
+            track_changes=True,
+            compact=self.option_compact_host_tables,
         )
+        self.evict_stale_rows("bridge_host", changes)
 
         for uid, vals in self.ds["bridge_host"].items():
             self.ds["bridge"][vals["bridge"]] = True
@@ -953,14 +1519,16 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         for uid, vals in self.ds["interface"].items():
             self.ds["interface"][uid]["client-ip-address"] = ""
             self.ds["interface"][uid]["client-mac-address"] = ""
-            for arp_uid, arp_vals in self.ds["arp"].items():
-                if arp_vals["interface"] != vals["name"] and not (
-                    vals["name"] in self.ds["bonding_slaves"]
-                    and self.ds["bonding_slaves"][vals["name"]]["master"]
-                    == arp_vals["interface"]
-                ):
-                    continue
 
+            # ARP entries on the port itself or on its bond master
+            arp_uids = self.ds["arp"].find_all("interface", vals["name"])
+            if vals["name"] in self.ds["bonding_slaves"]:
+                arp_uids += self.ds["arp"].find_all(
+                    "interface", self.ds["bonding_slaves"][vals["name"]]["master"]
+                )
+
+            for arp_uid in arp_uids:
+                arp_vals = self.ds["arp"][arp_uid]
                 if self.ds["interface"][uid]["client-ip-address"] == "":
                     self.ds["interface"][uid]["client-ip-address"] = arp_vals["address"]
                 else:
@@ -985,13 +1553,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["interface"][uid]["client-mac-address"] = "none"
 
     # ---------------------------
-    #   get_nat
+    #   async_get_nat
     # ---------------------------
-    def get_nat(self) -> None:
+    async def async_get_nat(self) -> None:
         """Get NAT data from Mikrotik"""
-        self.ds["nat"] = parse_api(
+        self.ds["nat"], changes = await self.async_query_parse(
+            "/ip/firewall/nat",
             data=self.ds["nat"],
-            source=self.api.query("/ip/firewall/nat"),
             key=".id",
             vals=[
                 {"name": ".id"},
@@ -1040,7 +1608,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 ],
             ],
             only=[{"key": "action", "value": "dst-nat"}],
+            track_changes=True,
         )
+        self.evict_stale_rows("nat", changes)
 
         # Remove duplicate NAT entries to prevent crash
         nat_uniq = {}
@@ -1067,13 +1637,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             del self.ds["nat"][uid]
 
     # ---------------------------
-    #   get_mangle
+    #   async_get_mangle
     # ---------------------------
-    def get_mangle(self) -> None:
+    async def async_get_mangle(self) -> None:
         """Get Mangle data from Mikrotik"""
-        self.ds["mangle"] = parse_api(
+        self.ds["mangle"] = await self.async_query_parse(
+            "/ip/firewall/mangle",
             data=self.ds["mangle"],
-            source=self.api.query("/ip/firewall/mangle"),
             key=".id",
             vals=[
                 {"name": ".id"},
@@ -1159,13 +1729,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             del self.ds["mangle"][uid]
 
     # ---------------------------
-    #   get_filter
+    #   async_get_filter
     # ---------------------------
-    def get_filter(self) -> None:
+    async def async_get_filter(self) -> None:
         """Get Filter data from Mikrotik"""
-        self.ds["filter"] = parse_api(
+        self.ds["filter"] = await self.async_query_parse(
+            "/ip/firewall/filter",
             data=self.ds["filter"],
-            source=self.api.query("/ip/firewall/filter"),
             key=".id",
             vals=[
                 {"name": ".id"},
@@ -1269,13 +1839,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             del self.ds["filter"][uid]
 
     # ---------------------------
-    #   get_kidcontrol
+    #   async_get_kidcontrol
     # ---------------------------
-    def get_kidcontrol(self) -> None:
+    async def async_get_kidcontrol(self) -> None:
         """Get Kid-control data from Mikrotik"""
-        self.ds["kid-control"] = parse_api(
+        self.ds["kid-control"] = await self.async_query_parse(
+            "/ip/kid-control",
             data=self.ds["kid-control"],
-            source=self.api.query("/ip/kid-control"),
             key="name",
             vals=[
                 {"name": "name"},
@@ -1305,45 +1875,46 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             )
 
     # ---------------------------
-    #   get_ppp
+    #   async_get_ppp
     # ---------------------------
-    def get_ppp(self) -> None:
+    async def async_get_ppp(self) -> None:
         """Get PPP data from Mikrotik"""
-        self.ds["ppp_secret"] = parse_api(
-            data=self.ds["ppp_secret"],
-            source=self.api.query("/ppp/secret"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "service"},
-                {"name": "profile"},
-                {"name": "comment"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
-            ensure_vals=[
-                {"name": "caller-id", "default": ""},
-                {"name": "address", "default": ""},
-                {"name": "encoding", "default": ""},
-                {"name": "connected", "default": False},
-            ],
-        )
-
-        self.ds["ppp_active"] = parse_api(
-            data={},
-            source=self.api.query("/ppp/active"),
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "service"},
-                {"name": "caller-id"},
-                {"name": "address"},
-                {"name": "encoding"},
-            ],
+        self.ds["ppp_secret"], self.ds["ppp_active"] = await asyncio.gather(
+            self.async_query_parse(
+                "/ppp/secret",
+                data=self.ds["ppp_secret"],
+                key="name",
+                vals=[
+                    {"name": "name"},
+                    {"name": "service"},
+                    {"name": "profile"},
+                    {"name": "comment"},
+                    {
+                        "name": "enabled",
+                        "source": "disabled",
+                        "type": "bool",
+                        "reverse": True,
+                    },
+                ],
+                ensure_vals=[
+                    {"name": "caller-id", "default": ""},
+                    {"name": "address", "default": ""},
+                    {"name": "encoding", "default": ""},
+                    {"name": "connected", "default": False},
+                ],
+            ),
+            self.async_query_parse(
+                "/ppp/active",
+                data={},
+                key="name",
+                vals=[
+                    {"name": "name"},
+                    {"name": "service"},
+                    {"name": "caller-id"},
+                    {"name": "address"},
+                    {"name": "encoding"},
+                ],
+            ),
         )
 
         for uid in self.ds["ppp_secret"]:
@@ -1369,13 +1940,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["ppp_secret"][uid]["encoding"] = "not connected"
 
     # ---------------------------
-    #   get_netwatch
+    #   async_get_netwatch
     # ---------------------------
-    def get_netwatch(self) -> None:
+    async def async_get_netwatch(self) -> None:
         """Get netwatch data from Mikrotik"""
-        self.ds["netwatch"] = parse_api(
+        self.ds["netwatch"] = await self.async_query_parse(
+            "/tool/netwatch",
             data=self.ds["netwatch"],
-            source=self.api.query("/tool/netwatch"),
             key="host",
             vals=[
                 {"name": "host"},
@@ -1395,9 +1966,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
     # ---------------------------
-    #   get_system_routerboard
+    #   async_get_system_routerboard
     # ---------------------------
-    def get_system_routerboard(self) -> None:
+    async def async_get_system_routerboard(self) -> None:
         """Get routerboard data from Mikrotik"""
         if self.ds["resource"]["board-name"].startswith("x86") or self.ds["resource"][
             "board-name"
@@ -1406,9 +1977,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             self.ds["routerboard"]["model"] = self.ds["resource"]["board-name"]
             self.ds["routerboard"]["serial-number"] = "N/A"
         else:
-            self.ds["routerboard"] = parse_api(
+            self.ds["routerboard"] = await self.async_query_parse(
+                "/system/routerboard",
                 data=self.ds["routerboard"],
-                source=self.api.query("/system/routerboard"),
                 vals=[
                     {"name": "routerboard", "type": "bool"},
                     {"name": "model", "default": "unknown"},
@@ -1427,9 +1998,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["routerboard"].pop("upgrade-firmware")
 
     # ---------------------------
-    #   get_system_health
+    #   async_get_system_health
     # ---------------------------
-    def get_system_health(self) -> None:
+    async def async_get_system_health(self) -> None:
         """Get routerboard data from Mikrotik"""
         if (
             "write" not in self.ds["access"]
@@ -1439,9 +2010,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             return
 
         if 0 < self.major_fw_version < 7:
-            self.ds["health"] = parse_api(
+            self.ds["health"] = await self.async_query_parse(
+                "/system/health",
                 data=self.ds["health"],
-                source=self.api.query("/system/health"),
                 vals=[
                     {"name": "temperature", "default": 0},
                     {"name": "voltage", "default": 0},
@@ -1454,9 +2025,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 ],
             )
         elif 0 < self.major_fw_version >= 7:
-            self.ds["health7"] = parse_api(
+            self.ds["health7"] = await self.async_query_parse(
+                "/system/health",
                 data=self.ds["health7"],
-                source=self.api.query("/system/health"),
                 key="name",
                 vals=[
                     {"name": "value", "default": "unknown"},
@@ -1467,13 +2038,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     self.ds["health"][uid] = vals["value"]
 
     # ---------------------------
-    #   get_system_resource
+    #   async_get_system_resource
     # ---------------------------
-    def get_system_resource(self) -> None:
+    async def async_get_system_resource(self) -> None:
         """Get system resources data from Mikrotik"""
-        self.ds["resource"] = parse_api(
+        self.ds["resource"] = await self.async_query_parse(
+            "/system/resource",
             data=self.ds["resource"],
-            source=self.api.query("/system/resource"),
             vals=[
                 {"name": "platform", "default": "unknown"},
                 {"name": "board-name", "default": "unknown"},
@@ -1557,15 +2128,15 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             "uptime_epoch" in self.ds["resource"]
             and self.rebootcheck > self.ds["resource"]["uptime_epoch"]
         ):
-            self.get_firmware_update()
+            await self.async_get_firmware_update()
 
         if "uptime_epoch" in self.ds["resource"]:
             self.rebootcheck = self.ds["resource"]["uptime_epoch"]
 
     # ---------------------------
-    #   get_firmware_update
+    #   async_get_firmware_update
     # ---------------------------
-    def get_firmware_update(self) -> None:
+    async def async_get_firmware_update(self) -> None:
         """Check for firmware update on Mikrotik"""
         if (
             "write" not in self.ds["access"]
@@ -1574,12 +2145,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         ):
             return
 
-        self.execute(
+        # Changes no configuration, so tier schedules are not reset
+        await self.api.execute(
             "/system/package/update", "check-for-updates", None, None, {"duration": 10}
         )
-        self.ds["fw-update"] = parse_api(
+        self.ds["fw-update"] = await self.async_query_parse(
+            "/system/package/update",
             data=self.ds["fw-update"],
-            source=self.api.query("/system/package/update"),
             vals=[
                 {"name": "status"},
                 {"name": "channel", "default": "unknown"},
@@ -1618,13 +2190,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 )
 
     # ---------------------------
-    #   get_ups
+    #   async_get_ups
     # ---------------------------
-    def get_ups(self) -> None:
+    async def async_get_ups(self) -> None:
         """Get UPS info from Mikrotik"""
-        self.ds["ups"] = parse_api(
+        self.ds["ups"] = await self.async_query_parse(
+            "/system/ups",
             data=self.ds["ups"],
-            source=self.api.query("/system/ups"),
             vals=[
                 {"name": "name", "default": "unknown"},
                 {"name": "offline-time", "default": "unknown"},
@@ -1652,13 +2224,11 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             ],
         )
         if self.ds["ups"]["enabled"]:
-            self.ds["ups"] = parse_api(
+            self.ds["ups"] = await self.async_query_parse(
+                "/system/ups",
+                command="monitor",
+                args={".id": 0, "once": True},
                 data=self.ds["ups"],
-                source=self.api.query(
-                    "/system/ups",
-                    command="monitor",
-                    args={".id": 0, "once": True},
-                ),
                 vals=[
                     {"name": "on-line", "type": "bool"},
                     {"name": "runtime-left", "default": 0},
@@ -1671,17 +2241,15 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             )
 
     # ---------------------------
-    #   get_gps
+    #   async_get_gps
     # ---------------------------
-    def get_gps(self) -> None:
+    async def async_get_gps(self) -> None:
         """Get GPS data from Mikrotik"""
-        self.ds["gps"] = parse_api(
+        self.ds["gps"] = await self.async_query_parse(
+            "/system/gps",
+            command="monitor",
+            args={"once": True},
             data=self.ds["gps"],
-            source=self.api.query(
-                "/system/gps",
-                command="monitor",
-                args={"once": True},
-            ),
             vals=[
                 {"name": "valid", "type": "bool"},
                 {"name": "latitude", "default": "unknown"},
@@ -1698,13 +2266,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
     # ---------------------------
-    #   get_script
+    #   async_get_script
     # ---------------------------
-    def get_script(self) -> None:
+    async def async_get_script(self) -> None:
         """Get list of all scripts from Mikrotik"""
-        self.ds["script"] = parse_api(
+        self.ds["script"] = await self.async_query_parse(
+            "/system/script",
             data=self.ds["script"],
-            source=self.api.query("/system/script"),
             key="name",
             vals=[
                 {"name": "name"},
@@ -1714,13 +2282,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
     # ---------------------------
-    #   get_environment
+    #   async_get_environment
     # ---------------------------
-    def get_environment(self) -> None:
+    async def async_get_environment(self) -> None:
         """Get list of all environment variables from Mikrotik"""
-        self.ds["environment"] = parse_api(
+        self.ds["environment"] = await self.async_query_parse(
+            "/system/script/environment",
             data=self.ds["environment"],
-            source=self.api.query("/system/script/environment"),
             key="name",
             vals=[
                 {"name": "name"},
@@ -1729,13 +2297,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
     # ---------------------------
-    #   get_captive
+    #   async_get_captive
     # ---------------------------
-    def get_captive(self) -> None:
+    async def async_get_captive(self) -> None:
         """Get list of all environment variables from Mikrotik"""
-        self.ds["hostspot_host"] = parse_api(
+        self.ds["hostspot_host"] = await self.async_query_parse(
+            "/ip/hotspot/host",
             data={},
-            source=self.api.query("/ip/hotspot/host"),
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -1752,13 +2320,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         self.ds["resource"]["captive_authorized"] = auth_hosts
 
     # ---------------------------
-    #   get_queue
+    #   async_get_queue
     # ---------------------------
-    def get_queue(self) -> None:
+    async def async_get_queue(self) -> None:
         """Get Queue data from Mikrotik"""
-        self.ds["queue"] = parse_api(
+        self.ds["queue"], changes = await self.async_query_parse(
+            "/queue/simple",
             data=self.ds["queue"],
-            source=self.api.query("/queue/simple"),
             key="name",
             vals=[
                 {"name": ".id"},
@@ -1780,9 +2348,12 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     "reverse": True,
                 },
             ],
+            track_changes=True,
         )
+        self.evict_stale_rows("queue", changes)
 
-        for uid, vals in self.ds["queue"].items():
+        for uid in changes.updated:
+            vals = self.ds["queue"][uid]
             self.ds["queue"][uid]["comment"] = str(self.ds["queue"][uid]["comment"])
 
             upload_max_limit_bps, download_max_limit_bps = [
@@ -1830,17 +2401,25 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             self.ds["queue"][uid]["download-burst-time"] = download_burst_time
 
     # ---------------------------
-    #   get_arp
+    #   async_get_arp
     # ---------------------------
-    def get_arp(self) -> None:
+    async def async_get_arp(self) -> None:
         """Get ARP data from Mikrotik"""
-        self.ds["arp"] = parse_api(
+        self.ds["arp"], changes = await self.async_query_parse(
+            "/ip/arp",
             data=self.ds["arp"],
-            source=self.api.query("/ip/arp"),
             key="mac-address",
-            vals=[{"name": "mac-address"}, {"name": "address"}, {"name": "interface"}],
+            vals=[
+                {"name": "mac-address"},
+                {"name": "address"},
+                {"name": "interface"},
+                {"name": "status", "default": "unknown"},
+            ],
             ensure_vals=[{"name": "bridge", "default": ""}],
+            track_changes=True,
+            compact=self.option_compact_host_tables,
         )
+        self.evict_stale_rows("arp", changes)
 
         for uid, vals in self.ds["arp"].items():
             if vals["interface"] in self.ds["bridge"] and uid in self.ds["bridge_host"]:
@@ -1848,6 +2427,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["arp"][uid]["interface"] = self.ds["bridge_host"][uid][
                     "interface"
                 ]
+                self.ds["arp"].reindex(uid)
 
         if self.ds["dhcp-client"]:
             to_remove = [
@@ -1860,28 +2440,38 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["arp"].pop(uid)
 
     # ---------------------------
-    #   get_dns
+    #   async_get_dns
     # ---------------------------
-    def get_dns(self) -> None:
+    async def async_get_dns(self) -> None:
         """Get static DNS data from Mikrotik"""
-        self.ds["dns"] = parse_api(
+        self.ds["dns"], changes = await self.async_query_parse(
+            "/ip/dns/static",
             data=self.ds["dns"],
-            source=self.api.query("/ip/dns/static"),
             key="name",
             vals=[{"name": "name"}, {"name": "address"}, {"name": "comment"}],
+            track_changes=True,
         )
 
-        for uid, vals in self.ds["dns"].items():
+        for uid in changes.updated:
             self.ds["dns"][uid]["comment"] = str(self.ds["dns"][uid]["comment"])
 
+        # Host names by address, first static entry for an address wins
+        if changes.updated:
+            self.dns_host_names = {}
+            for vals in self.ds["dns"].values():
+                self.dns_host_names.setdefault(
+                    vals["address"],
+                    (vals["comment"].split("#", 1)[0], vals["name"].split(".")[0]),
+                )
+
     # ---------------------------
-    #   get_dhcp
+    #   async_get_dhcp
     # ---------------------------
-    def get_dhcp(self) -> None:
+    async def async_get_dhcp(self) -> None:
         """Get DHCP data from Mikrotik"""
-        self.ds["dhcp"] = parse_api(
+        self.ds["dhcp"], changes = await self.async_query_parse(
+            "/ip/dhcp-server/lease",
             data=self.ds["dhcp"],
-            source=self.api.query("/ip/dhcp-server/lease"),
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -1901,10 +2491,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 },
             ],
             ensure_vals=[{"name": "interface", "default": "unknown"}],
+            track_changes=True,
+            compact=self.option_compact_host_tables,
         )
+        self.evict_stale_rows("dhcp", changes)
 
-        dhcpserver_query = False
-        for uid in self.ds["dhcp"]:
+        # Address fixups only depend on the lease itself
+        for uid in changes.updated:
             self.ds["dhcp"][uid]["comment"] = str(self.ds["dhcp"][uid]["comment"])
 
             # is_valid_ip
@@ -1929,11 +2522,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                         "active-mac-address"
                     ]
 
+        dhcpserver_query = False
+        for uid in self.ds["dhcp"]:
             if (
                 not dhcpserver_query
                 and self.ds["dhcp"][uid]["server"] not in self.ds["dhcp-server"]
             ):
-                self.get_dhcp_server()
+                await self.async_get_dhcp_server()
                 dhcpserver_query = True
 
             if self.ds["dhcp"][uid]["server"] in self.ds["dhcp-server"]:
@@ -1947,13 +2542,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     self.ds["dhcp"][uid]["interface"] = self.ds["arp"][uid]["interface"]
 
     # ---------------------------
-    #   get_dhcp_server
+    #   async_get_dhcp_server
     # ---------------------------
-    def get_dhcp_server(self) -> None:
+    async def async_get_dhcp_server(self) -> None:
         """Get DHCP server data from Mikrotik"""
-        self.ds["dhcp-server"] = parse_api(
+        self.ds["dhcp-server"] = await self.async_query_parse(
+            "/ip/dhcp-server",
             data=self.ds["dhcp-server"],
-            source=self.api.query("/ip/dhcp-server"),
             key="name",
             vals=[
                 {"name": "name"},
@@ -1962,13 +2557,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
     # ---------------------------
-    #   get_dhcp_client
+    #   async_get_dhcp_client
     # ---------------------------
-    def get_dhcp_client(self) -> None:
+    async def async_get_dhcp_client(self) -> None:
         """Get DHCP client data from Mikrotik"""
-        self.ds["dhcp-client"] = parse_api(
+        self.ds["dhcp-client"] = await self.async_query_parse(
+            "/ip/dhcp-client",
             data=self.ds["dhcp-client"],
-            source=self.api.query("/ip/dhcp-client"),
             key="interface",
             vals=[
                 {"name": "interface", "default": "unknown"},
@@ -1978,13 +2573,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
     # ---------------------------
-    #   get_dhcp_network
+    #   async_get_dhcp_network
     # ---------------------------
-    def get_dhcp_network(self) -> None:
+    async def async_get_dhcp_network(self) -> None:
         """Get DHCP network data from Mikrotik"""
-        self.ds["dhcp-network"] = parse_api(
+        self.ds["dhcp-network"], changes = await self.async_query_parse(
+            "/ip/dhcp-server/network",
             data=self.ds["dhcp-network"],
-            source=self.api.query("/ip/dhcp-server/network"),
             key="address",
             vals=[
                 {"name": "address"},
@@ -1994,6 +2589,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 {"name": "domain", "default": ""},
             ],
             ensure_vals=[{"name": "address"}, {"name": "IPv4Network", "default": ""}],
+            track_changes=True,
         )
 
         for uid, vals in self.ds["dhcp-network"].items():
@@ -2002,10 +2598,15 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     vals["address"]
                 )
 
+        if changes.updated:
+            self.local_networks = NetworkClassifier(
+                vals["IPv4Network"] for vals in self.ds["dhcp-network"].values()
+            )
+
     # ---------------------------
-    #   get_capsman_hosts
+    #   async_get_capsman_hosts
     # ---------------------------
-    def get_capsman_hosts(self) -> None:
+    async def async_get_capsman_hosts(self) -> None:
         """Get CAPS-MAN hosts data from Mikrotik"""
 
         if self.major_fw_version > 7 or (
@@ -2016,9 +2617,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         else:
             registration_path = "/caps-man/registration-table"
 
-        self.ds["capsman_hosts"] = parse_api(
+        self.ds["capsman_hosts"] = await self.async_query_parse(
+            registration_path,
             data={},
-            source=self.api.query(registration_path),
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -2028,14 +2629,14 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
     # ---------------------------
-    #   get_wireless
+    #   async_get_wireless
     # ---------------------------
-    def get_wireless(self) -> None:
+    async def async_get_wireless(self) -> None:
         """Get wireless data from Mikrotik"""
 
-        self.ds["wireless"] = parse_api(
+        self.ds["wireless"], changes = await self.async_query_parse(
+            f"/interface/{self._wifimodule}",
             data=self.ds["wireless"],
-            source=self.api.query(f"/interface/{self._wifimodule}"),
             key="name",
             vals=[
                 {"name": "master-interface", "default": ""},
@@ -2063,7 +2664,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 {"name": "running", "type": "bool"},
                 {"name": "disabled", "type": "bool"},
             ],
+            track_changes=True,
         )
+        self.evict_stale_rows("wireless", changes)
 
         for uid in self.ds["wireless"]:
             if self.ds["wireless"][uid]["master-interface"]:
@@ -2078,13 +2681,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     self.ds["interface"][uid][tmp] = self.ds["wireless"][uid][tmp]
 
     # ---------------------------
-    #   get_wireless_hosts
+    #   async_get_wireless_hosts
     # ---------------------------
-    def get_wireless_hosts(self) -> None:
+    async def async_get_wireless_hosts(self) -> None:
         """Get wireless hosts data from Mikrotik"""
-        self.ds["wireless_hosts"] = parse_api(
+        self.ds["wireless_hosts"] = await self.async_query_parse(
+            f"/interface/{self._wifimodule}/registration-table",
             data={},
-            source=self.api.query(f"/interface/{self._wifimodule}/registration-table"),
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -2102,37 +2705,132 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     #   async_process_host
     # ---------------------------
     async def async_process_host(self) -> None:
-        """Get host tracking data"""
+        """Get host tracking data
+
+        The merge runs in the executor on copies of the source tables, only
+        copying and applying the result blocks the event loop.
+        """
+        async with self.host_lock:
+            start = perf_counter()
+            # Collectors update rows while the merge runs, so source rows are
+            # taken as tuples of the fields it reads instead of whole copies
+            snapshot = {}
+            for name, fields in HOST_SOURCE_FIELDS.items():
+                get_fields = itemgetter(*fields)
+                snapshot[name] = {
+                    uid: get_fields(vals) for uid, vals in self.ds[name].items()
+                }
+
+            snapshot["host"] = {
+                uid: dict(vals) for uid, vals in self.ds["host"].items()
+            }
+            snapshot["host_hass"] = dict(self.ds["host_hass"])
+            snapshot["dns"] = self.dns_host_names
+            snapshot["inputs"] = self.host_inputs
+            snapshot["dirty"] = self.host_dirty
+            snapshot["recover"] = not self.host_hass_recovered
+            self.host_hass_recovered = True
+            blocked = perf_counter() - start
+
+            result = await self.hass.async_add_executor_job(self.process_host, snapshot)
+
+            start = perf_counter()
+            self.host_inputs = result["inputs"]
+            self.host_dirty = result["dirty"]
+            for uid, fields in result["updates"].items():
+                if uid in self.ds["host"]:
+                    self.ds["host"][uid].update(fields)
+                else:
+                    self.ds["host"][uid] = fields
+
+            for uid, keys in result["deleted"].items():
+                for key in keys:
+                    self.ds["host"][uid].pop(key, None)
+
+            self.ds["resource"].update(result["resource"])
+            blocked += perf_counter() - start
+            _LOGGER.debug(
+                "Mikrotik %s host processing blocked event loop for %.1f ms,"
+                " %s of %s hosts recomputed",
+                self.host,
+                blocked * 1000,
+                result["recomputed"],
+                len(self.ds["host"]),
+            )
+
+            await self.async_process_host_vendors(result["lookup"])
+
+    # ---------------------------
+    #   process_host
+    # ---------------------------
+    def process_host(self, snapshot) -> dict:
+        """Merge host sources, safe to run in the executor.
+
+        Returns field changes for the host table and the change tracking
+        state for the next run, both are applied on the event loop by
+        async_process_host. Host addresses are only recomputed for hosts
+        whose DHCP or ARP rows changed since the previous run, or when
+        static DNS changed.
+        """
+        original = snapshot["host"]
+        hosts = {uid: dict(vals) for uid, vals in original.items()}
+
+        # Find hosts whose source rows changed since the previous run
+        inputs = {"dhcp": snapshot["dhcp"], "arp": snapshot["arp"]}
+        dirty = set(snapshot["dirty"])
+        for name, rows in inputs.items():
+            previous = snapshot["inputs"].get(name, {})
+            dirty.update(
+                uid
+                for uid in rows.keys() | previous.keys()
+                if rows.get(uid) != previous.get(uid)
+            )
+
+        if snapshot["dns"] is not snapshot["inputs"].get("dns"):
+            dirty.update(hosts)
+
+        inputs["dns"] = snapshot["dns"]
+        snapshot = {
+            **snapshot,
+            **{
+                name: {
+                    uid: dict(zip(fields, values))
+                    for uid, values in snapshot[name].items()
+                }
+                for name, fields in HOST_SOURCE_FIELDS.items()
+            },
+        }
+
         # Add hosts from CAPS-MAN
         capsman_detected = {}
         if self.support_capsman:
-            for uid, vals in self.ds["capsman_hosts"].items():
-                if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "capsman"}
-                elif self.ds["host"][uid]["source"] != "capsman":
+            for uid, vals in snapshot["capsman_hosts"].items():
+                if uid not in hosts:
+                    hosts[uid] = {"source": "capsman"}
+                elif hosts[uid]["source"] != "capsman":
                     continue
 
                 capsman_detected[uid] = True
-                self.ds["host"][uid]["available"] = True
-                self.ds["host"][uid]["last-seen"] = utcnow()
+                hosts[uid]["available"] = True
+                hosts[uid]["last-seen"] = utcnow()
                 for key in ["mac-address", "interface"]:
-                    self.ds["host"][uid][key] = vals[key]
+                    hosts[uid][key] = vals[key]
 
         # Add hosts from wireless
         wireless_detected = {}
         if self.support_wireless:
-            for uid, vals in self.ds["wireless_hosts"].items():
+            for uid, vals in snapshot["wireless_hosts"].items():
                 if vals["ap"]:
                     continue
 
-                if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "wireless"}
-                elif self.ds["host"][uid]["source"] != "wireless":
+                if uid not in hosts:
+                    hosts[uid] = {"source": "wireless"}
+                elif hosts[uid]["source"] != "wireless":
                     continue
 
                 wireless_detected[uid] = True
-                self.ds["host"][uid]["available"] = True
-                self.ds["host"][uid]["last-seen"] = utcnow()
+                hosts[uid]["available"] = True
+                hosts[uid]["last-seen"] = utcnow()
                 for key in [
                     "mac-address",
                     "interface",
@@ -2141,41 +2839,43 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     "tx-rate",
                     "rx-rate",
                 ]:
-                    self.ds["host"][uid][key] = vals[key]
+                    hosts[uid][key] = vals[key]
 
         # Add hosts from DHCP
-        for uid, vals in self.ds["dhcp"].items():
+        for uid in dirty & snapshot["dhcp"].keys():
+            vals = snapshot["dhcp"][uid]
             if not vals["enabled"]:
                 continue
 
-            if uid not in self.ds["host"]:
-                self.ds["host"][uid] = {"source": "dhcp"}
-            elif self.ds["host"][uid]["source"] != "dhcp":
+            if uid not in hosts:
+                hosts[uid] = {"source": "dhcp"}
+            elif hosts[uid]["source"] != "dhcp":
                 continue
 
             for key in ["address", "mac-address", "interface"]:
-                self.ds["host"][uid][key] = vals[key]
+                hosts[uid][key] = vals[key]
 
         # Add hosts from ARP
-        for uid, vals in self.ds["arp"].items():
-            if uid not in self.ds["host"]:
-                self.ds["host"][uid] = {"source": "arp"}
-            elif self.ds["host"][uid]["source"] != "arp":
+        for uid in dirty & snapshot["arp"].keys():
+            vals = snapshot["arp"][uid]
+            if uid not in hosts:
+                hosts[uid] = {"source": "arp"}
+            elif hosts[uid]["source"] != "arp":
                 continue
 
             for key in ["address", "mac-address", "interface"]:
-                self.ds["host"][uid][key] = vals[key]
+                hosts[uid][key] = vals[key]
 
         # Add restored hosts from hass registry
-        if not self.host_hass_recovered:
-            self.host_hass_recovered = True
-            for uid in self.ds["host_hass"]:
-                if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "restored"}
-                    self.ds["host"][uid]["mac-address"] = uid
-                    self.ds["host"][uid]["host-name"] = self.ds["host_hass"][uid]
-
-        for uid, vals in self.ds["host"].items():
+        if snapshot["recover"]:
+            for uid in snapshot["host_hass"]:
+                if uid not in hosts:
+                    hosts[uid] = {"source": "restored"}
+                    hosts[uid]["mac-address"] = uid
+                    hosts[uid]["host-name"] = snapshot["host_hass"][uid]
+
+        for uid in hosts.keys() - original.keys():
+            dirty.add(uid)
             # Add missing default values
             for key, default in zip(
                 [
@@ -2189,138 +2889,164 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 ],
                 ["unknown", "unknown", "unknown", "unknown", "detect", False, False],
             ):
-                if key not in self.ds["host"][uid]:
-                    self.ds["host"][uid][key] = default
-
-        # if not self.host_tracking_initialized:
-        #     await self.async_ping_tracked_hosts()
+                if key not in hosts[uid]:
+                    hosts[uid][key] = default
 
         # Process hosts
-        self.ds["resource"]["clients_wired"] = 0
-        self.ds["resource"]["clients_wireless"] = 0
-        for uid, vals in self.ds["host"].items():
+        resource = {"clients_wired": 0, "clients_wireless": 0}
+        lookup = []
+        for uid, vals in hosts.items():
             # Captive portal data
             if self.option_sensor_client_captive:
-                if uid in self.ds["hostspot_host"]:
-                    self.ds["host"][uid]["authorized"] = self.ds["hostspot_host"][uid][
-                        "authorized"
-                    ]
-                    self.ds["host"][uid]["bypassed"] = self.ds["hostspot_host"][uid][
-                        "bypassed"
-                    ]
-                elif "authorized" in self.ds["host"][uid]:
-                    del self.ds["host"][uid]["authorized"]
-                    del self.ds["host"][uid]["bypassed"]
+                if uid in snapshot["hostspot_host"]:
+                    vals["authorized"] = snapshot["hostspot_host"][uid]["authorized"]
+                    vals["bypassed"] = snapshot["hostspot_host"][uid]["bypassed"]
+                elif "authorized" in vals:
+                    del vals["authorized"]
+                    del vals["bypassed"]
 
             # CAPS-MAN availability
             if vals["source"] == "capsman" and uid not in capsman_detected:
-                self.ds["host"][uid]["available"] = False
+                vals["available"] = False
 
             # Wireless availability
             if vals["source"] == "wireless" and uid not in wireless_detected:
-                self.ds["host"][uid]["available"] = False
+                vals["available"] = False
 
             # Update IP and interface (DHCP/returned host)
-            if (
-                uid in self.ds["dhcp"]
-                and self.ds["dhcp"][uid]["enabled"]
-                and "." in self.ds["dhcp"][uid]["address"]
+            if uid not in dirty:
+                pass
+            elif (
+                uid in snapshot["dhcp"]
+                and snapshot["dhcp"][uid]["enabled"]
+                and "." in snapshot["dhcp"][uid]["address"]
             ):
-                if self.ds["dhcp"][uid]["address"] != self.ds["host"][uid]["address"]:
-                    self.ds["host"][uid]["address"] = self.ds["dhcp"][uid]["address"]
+                if snapshot["dhcp"][uid]["address"] != vals["address"]:
+                    vals["address"] = snapshot["dhcp"][uid]["address"]
                     if vals["source"] not in ["capsman", "wireless"]:
-                        self.ds["host"][uid]["source"] = "dhcp"
-                        self.ds["host"][uid]["interface"] = self.ds["dhcp"][uid][
-                            "interface"
-                        ]
+                        vals["source"] = "dhcp"
+                        vals["interface"] = snapshot["dhcp"][uid]["interface"]
 
             elif (
-                uid in self.ds["arp"]
-                and "." in self.ds["arp"][uid]["address"]
-                and self.ds["arp"][uid]["address"] != self.ds["host"][uid]["address"]
+                uid in snapshot["arp"]
+                and "." in snapshot["arp"][uid]["address"]
+                and snapshot["arp"][uid]["address"] != vals["address"]
             ):
-                self.ds["host"][uid]["address"] = self.ds["arp"][uid]["address"]
+                vals["address"] = snapshot["arp"][uid]["address"]
                 if vals["source"] not in ["capsman", "wireless"]:
-                    self.ds["host"][uid]["source"] = "arp"
-                    self.ds["host"][uid]["interface"] = self.ds["arp"][uid]["interface"]
+                    vals["source"] = "arp"
+                    vals["interface"] = snapshot["arp"][uid]["interface"]
 
             if vals["host-name"] == "unknown":
                 # Resolve hostname from static DNS
-                if vals["address"] != "unknown":
-                    for dns_uid, dns_vals in self.ds["dns"].items():
-                        if dns_vals["address"] == vals["address"]:
-                            if dns_vals["comment"].split("#", 1)[0] != "":
-                                self.ds["host"][uid]["host-name"] = dns_vals[
-                                    "comment"
-                                ].split("#", 1)[0]
-                            elif (
-                                uid in self.ds["dhcp"]
-                                and self.ds["dhcp"][uid]["enabled"]
-                                and self.ds["dhcp"][uid]["comment"].split("#", 1)[0]
-                                != ""
-                            ):
-                                # Override name if DHCP comment exists
-                                self.ds["host"][uid]["host-name"] = self.ds["dhcp"][
-                                    uid
-                                ]["comment"].split("#", 1)[0]
-                            else:
-                                self.ds["host"][uid]["host-name"] = dns_vals[
-                                    "name"
-                                ].split(".")[0]
-                            break
-
-                if self.ds["host"][uid]["host-name"] == "unknown":
+                if vals["address"] != "unknown" and vals["address"] in snapshot["dns"]:
+                    dns_comment, dns_name = snapshot["dns"][vals["address"]]
+                    if dns_comment != "":
+                        vals["host-name"] = dns_comment
+                    elif (
+                        uid in snapshot["dhcp"]
+                        and snapshot["dhcp"][uid]["enabled"]
+                        and snapshot["dhcp"][uid]["comment"].split("#", 1)[0] != ""
+                    ):
+                        # Override name if DHCP comment exists
+                        vals["host-name"] = snapshot["dhcp"][uid]["comment"].split(
+                            "#", 1
+                        )[0]
+                    else:
+                        vals["host-name"] = dns_name
+
+                if vals["host-name"] == "unknown":
                     # Resolve hostname from DHCP comment
                     if (
-                        uid in self.ds["dhcp"]
-                        and self.ds["dhcp"][uid]["enabled"]
-                        and self.ds["dhcp"][uid]["comment"].split("#", 1)[0] != ""
+                        uid in snapshot["dhcp"]
+                        and snapshot["dhcp"][uid]["enabled"]
+                        and snapshot["dhcp"][uid]["comment"].split("#", 1)[0] != ""
                     ):
-                        self.ds["host"][uid]["host-name"] = self.ds["dhcp"][uid][
-                            "comment"
-                        ].split("#", 1)[0]
+                        vals["host-name"] = snapshot["dhcp"][uid]["comment"].split(
+                            "#", 1
+                        )[0]
                     # Resolve hostname from DHCP hostname
                     elif (
-                        uid in self.ds["dhcp"]
-                        and self.ds["dhcp"][uid]["enabled"]
-                        and self.ds["dhcp"][uid]["host-name"] != "unknown"
+                        uid in snapshot["dhcp"]
+                        and snapshot["dhcp"][uid]["enabled"]
+                        and snapshot["dhcp"][uid]["host-name"] != "unknown"
                     ):
-                        self.ds["host"][uid]["host-name"] = self.ds["dhcp"][uid][
-                            "host-name"
-                        ]
+                        vals["host-name"] = snapshot["dhcp"][uid]["host-name"]
                     # Fallback to mac address for hostname
                     else:
-                        self.ds["host"][uid]["host-name"] = uid
-
-            # Resolve manufacturer
-            if vals["manufacturer"] == "detect" and vals["mac-address"] != "unknown":
-                try:
-                    self.ds["host"][uid]["manufacturer"] = (
-                        await self.async_mac_lookup.lookup(vals["mac-address"])
-                    )
-                except Exception:
-                    self.ds["host"][uid]["manufacturer"] = ""
+                        vals["host-name"] = uid
 
+            # Resolve manufacturer in async_process_host_vendors
             if vals["manufacturer"] == "detect":
-                self.ds["host"][uid]["manufacturer"] = ""
+                if vals["mac-address"] != "unknown":
+                    lookup.append(uid)
+                else:
+                    vals["manufacturer"] = ""
 
             # Count hosts
-            if self.ds["host"][uid]["available"]:
+            if vals["available"]:
                 if vals["source"] in ["capsman", "wireless"]:
-                    self.ds["resource"]["clients_wireless"] += 1
+                    resource["clients_wireless"] += 1
                 else:
-                    self.ds["resource"]["clients_wired"] += 1
+                    resource["clients_wired"] += 1
+
+        # Return changed fields only, the tracker may update hosts meanwhile
+        updates = {}
+        deleted = {}
+        for uid, vals in hosts.items():
+            if uid not in original:
+                updates[uid] = vals
+                continue
+
+            if changed := {
+                key: value
+                for key, value in vals.items()
+                if key not in original[uid] or original[uid][key] != value
+            }:
+                updates[uid] = changed
+
+            if removed := original[uid].keys() - vals.keys():
+                deleted[uid] = removed
+
+        return {
+            "inputs": inputs,
+            # Hosts that switched source pick up that source on the next run
+            "dirty": {uid for uid, vals in updates.items() if "source" in vals},
+            "updates": updates,
+            "deleted": deleted,
+            "resource": resource,
+            "lookup": lookup,
+            "recomputed": len(dirty & hosts.keys()),
+        }
 
     # ---------------------------
-    #   process_accounting
+    #   async_process_host_vendors
     # ---------------------------
-    def process_accounting(self) -> None:
+    async def async_process_host_vendors(self, uids) -> None:
+        """Resolve host manufacturers from MAC addresses"""
+        macs = {
+            uid: self.ds["host"][uid]["mac-address"]
+            for uid in uids
+            if uid in self.ds["host"]
+        }
+        if not macs:
+            return
+
+        vendors = await self.mac_vendors.async_resolve(macs.values())
+        for uid, mac in macs.items():
+            if uid in self.ds["host"]:
+                self.ds["host"][uid]["manufacturer"] = vendors[mac]
+
+    # ---------------------------
+    #   async_process_accounting
+    # ---------------------------
+    async def async_process_accounting(self) -> None:
         """Get Accounting data from Mikrotik"""
         # Check if accounting and account-local-traffic is enabled
         (
             accounting_enabled,
             local_traffic_enabled,
-        ) = self.api.is_accounting_and_local_traffic_enabled()
+        ) = await self.api.is_accounting_and_local_traffic_enabled()
 
         # Build missing hosts from main hosts dict
         for uid, vals in self.ds["host"].items():
@@ -2332,6 +3058,10 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     "available": False,
                     "local_accounting": False,
                 }
+            elif self.ds["client_traffic"][uid]["address"] != vals["address"]:
+                # Follow address changes, keeping the address index current
+                self.ds["client_traffic"][uid]["address"] = vals["address"]
+                self.ds["client_traffic"].reindex(uid)
 
         _LOGGER.debug(
             f"Working with {len(self.ds['client_traffic'])} accounting devices"
@@ -2348,11 +3078,11 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             for uid, vals in self.ds["client_traffic"].items()
         }
 
-        time_diff = self.api.take_client_traffic_snapshot(True)
+        time_diff = await self.api.take_client_traffic_snapshot(True)
         if time_diff:
-            accounting_data = parse_api(
+            accounting_data = await self.async_query_parse(
+                "/ip/accounting/snapshot",
                 data={},
-                source=self.api.query("/ip/accounting/snapshot"),
                 key=".id",
                 vals=[
                     {"name": ".id"},
@@ -2362,7 +3092,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 ],
             )
 
-            threshold = self.api.query("/ip/accounting")[0].get("threshold")
+            threshold = (await self.api.query("/ip/accounting"))[0].get("threshold")
             entry_count = len(accounting_data)
 
             if entry_count == threshold:
@@ -2379,32 +3109,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     " increasing the accounting threshold value in Mikrotik."
                 )
 
-            for item in accounting_data.values():
-                source_ip = str(item.get("src-address")).strip()
-                destination_ip = str(item.get("dst-address")).strip()
-                bits_count = int(str(item.get("bytes")).strip())
-
-                if self._address_part_of_local_network(
-                    source_ip
-                ) and self._address_part_of_local_network(destination_ip):
-                    # LAN TX/RX
-                    if source_ip in tmp_accounting_values:
-                        tmp_accounting_values[source_ip]["lan-tx"] += bits_count
-                    if destination_ip in tmp_accounting_values:
-                        tmp_accounting_values[destination_ip]["lan-rx"] += bits_count
-                elif self._address_part_of_local_network(
-                    source_ip
-                ) and not self._address_part_of_local_network(destination_ip):
-                    # WAN TX
-                    if source_ip in tmp_accounting_values:
-                        tmp_accounting_values[source_ip]["wan-tx"] += bits_count
-                elif (
-                    not self._address_part_of_local_network(source_ip)
-                    and self._address_part_of_local_network(destination_ip)
-                    and destination_ip in tmp_accounting_values
-                ):
-                    # WAN RX
-                    tmp_accounting_values[destination_ip]["wan-rx"] += bits_count
+            tmp_accounting_values = aggregate_traffic(
+                accounting_data.values(), self.local_networks, tmp_accounting_values
+            )
 
         # Calculate real throughput and transform it to appropriate unit
         # Also handle availability of accounting and local_accounting from Mikrotik
@@ -2441,42 +3148,23 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 round(vals["lan-rx"] / time_diff) if vals["lan-rx"] else 0.0
             )
 
-    # ---------------------------
-    #   _address_part_of_local_network
-    # ---------------------------
-    def _address_part_of_local_network(self, address) -> bool:
-        address = ip_address(address)
-        for vals in self.ds["dhcp-network"].values():
-            if address in vals["IPv4Network"]:
-                return True
-        return False
-
     # ---------------------------
     #   _get_accounting_uid_by_ip
     # ---------------------------
     def _get_accounting_uid_by_ip(self, requested_ip):
-        for mac, vals in self.ds["client_traffic"].items():
-            if vals.get("address") is requested_ip:
-                return mac
-        return None
+        return self.ds["client_traffic"].find("address", requested_ip)
 
     # ---------------------------
     #   _get_iface_from_entry
     # ---------------------------
     def _get_iface_from_entry(self, entry):
         """Get interface default-name using name from interface dict"""
-        uid = None
-        for ifacename in self.ds["interface"]:
-            if self.ds["interface"][ifacename]["name"] == entry["interface"]:
-                uid = ifacename
-                break
-
-        return uid
+        return self.ds["interface"].find("name", entry["interface"])
 
     # ---------------------------
-    #   process_kid_control
+    #   async_process_kid_control_devices
     # ---------------------------
-    def process_kid_control_devices(self) -> None:
+    async def async_process_kid_control_devices(self) -> None:
         """Get Kid Control Device data from Mikrotik"""
 
         # Build missing hosts from main hosts dict
@@ -2498,9 +3186,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             f"Working with {len(self.ds['client_traffic'])} kid control devices"
         )
 
-        kid_control_devices_data = parse_api(
+        kid_control_devices_data = await self.async_query_parse(
+            "/ip/kid-control/device",
             data={},
-            source=self.api.query("/ip/kid-control/device"),
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -2515,7 +3203,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             ],
         )
 
-        time_diff = self.api.take_client_traffic_snapshot(False)
+        time_diff = await self.api.take_client_traffic_snapshot(False)
 
         if not kid_control_devices_data:
             if "kid-control-devices" not in self.notified_flags:
@@ -186,13 +186,23 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._data = self.coordinator.data[self.entity_description.data_path]
-        if self._uid:
-            self._data = self.coordinator.data[self.entity_description.data_path][
-                self._uid
-            ]
+        data = self.coordinator.data[self.entity_description.data_path]
+        if not self._uid:
+            self._data = data
+        elif self._uid in data:
+            self._data = data[self._uid]
+
+        # Rows evicted from the coordinator keep their last data, unavailable
         super()._handle_coordinator_update()
 
+    @property
+    def available(self) -> bool:
+        """Return if entity data is available."""
+        return super().available and (
+            not self._uid
+            or self._uid in self.coordinator.data[self.entity_description.data_path]
+        )
+
     @property
     def custom_name(self) -> str:
         """Return the name for this entity"""
@@ -3,3 +3,19 @@
 
 class ApiEntryNotFound(Exception):
     """Api entry not found."""
+
+
+class ApiError(Exception):
+    """Generic RouterOS API error."""
+
+
+class ApiConnectionClosed(ApiError):
+    """RouterOS API connection closed."""
+
+
+class ApiTrapError(ApiError):
+    """RouterOS API command returned !trap."""
+
+
+class ApiFatalError(ApiError):
+    """RouterOS API session returned !fatal."""
@@ -0,0 +1,185 @@
+"""Indexed data tables for Mikrotik Router."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+
+# ---------------------------
+#   IndexedTable
+# ---------------------------
+class IndexedTable(dict):
+    """Table of rows by uid with secondary indexes on row fields.
+
+    Indexes follow rows added, replaced or removed through the table.
+    Rows changed in place must be passed to reindex(), parse_api does
+    this for every row it writes.
+    """
+
+    def __init__(self, *args, indexes=(), **kwargs):
+        """Initialize table and build declared indexes."""
+        super().__init__(*args, **kwargs)
+        self._indexes = {field: {} for field in indexes}
+        self._indexed = {}
+        for uid in self:
+            self.reindex(uid)
+
+    # ---------------------------
+    #   reindex
+    # ---------------------------
+    def reindex(self, uid) -> None:
+        """Update indexes for a single row."""
+        if not self._indexes:
+            return
+
+        row = self.get(uid)
+        values = tuple(
+            row.get(field) if row is not None else None for field in self._indexes
+        )
+        old_values = self._indexed.get(uid)
+        if values == old_values:
+            return
+
+        if old_values:
+            self._unindex(uid, old_values)
+
+        if row is None:
+            return
+
+        self._indexed[uid] = values
+        for index, value in zip(self._indexes.values(), values):
+            if value is not None:
+                index.setdefault(value, {})[uid] = None
+
+    # ---------------------------
+    #   _unindex
+    # ---------------------------
+    def _unindex(self, uid, values) -> None:
+        """Remove row from indexes."""
+        del self._indexed[uid]
+        for index, value in zip(self._indexes.values(), values):
+            if value is None:
+                continue
+
+            bucket = index[value]
+            del bucket[uid]
+            if not bucket:
+                del index[value]
+
+    # ---------------------------
+    #   find
+    # ---------------------------
+    def find(self, field, value):
+        """Return uid of the last row with field value, None if not found."""
+        bucket = self._indexes[field].get(value)
+        return next(reversed(bucket)) if bucket else None
+
+    # ---------------------------
+    #   find_all
+    # ---------------------------
+    def find_all(self, field, value) -> list:
+        """Return uids of all rows with field value."""
+        return list(self._indexes[field].get(value, ()))
+
+    # ---------------------------
+    #   keymap
+    # ---------------------------
+    def keymap(self, field) -> Mapping | None:
+        """Return field value to uid mapping, None if field is not indexed."""
+        if field not in self._indexes:
+            return None
+
+        return IndexKeymap(self, field)
+
+    # ---------------------------
+    #   dict interface
+    # ---------------------------
+    def __setitem__(self, uid, row) -> None:
+        """Set row and index it."""
+        super().__setitem__(uid, row)
+        self.reindex(uid)
+
+    def __delitem__(self, uid) -> None:
+        """Delete row and its index entries."""
+        super().__delitem__(uid)
+        self.reindex(uid)
+
+    def pop(self, uid, *args):
+        """Remove row and return it."""
+        row = super().pop(uid, *args)
+        self.reindex(uid)
+        return row
+
+    def popitem(self) -> tuple:
+        """Remove last row and return it."""
+        uid, row = super().popitem()
+        self.reindex(uid)
+        return uid, row
+
+    def setdefault(self, uid, default=None):
+        """Return row, adding default if missing."""
+        if uid not in self:
+            self[uid] = default
+
+        return self[uid]
+
+    def update(self, *args, **kwargs) -> None:
+        """Update rows and index them."""
+        for uid, row in dict(*args, **kwargs).items():
+            self[uid] = row
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        super().clear()
+        self._indexed.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    def __reduce__(self):
+        """Pickle and copy support, rows are indexed again on load."""
+        return (
+            _restore_table,
+            (dict(self), tuple(self._indexes)),
+        )
+
+
+# ---------------------------
+#   _restore_table
+# ---------------------------
+def _restore_table(rows, indexes) -> IndexedTable:
+    """Rebuild pickled or copied table."""
+    return IndexedTable(rows, indexes=indexes)
+
+
+# ---------------------------
+#   IndexKeymap
+# ---------------------------
+class IndexKeymap(Mapping):
+    """Read-only field value to uid view of an IndexedTable index."""
+
+    __slots__ = ("_table", "_field")
+
+    def __init__(self, table, field):
+        """Initialize view."""
+        self._table = table
+        self._field = field
+
+    def __getitem__(self, value):
+        """Return uid for field value."""
+        uid = self._table.find(self._field, value)
+        if uid is None:
+            raise KeyError(value)
+
+        return uid
+
+    def __contains__(self, value) -> bool:
+        """Return True if a row has field value."""
+        return value in self._table._indexes[self._field]
+
+    def __iter__(self):
+        """Iterate over indexed values."""
+        return iter(self._table._indexes[self._field])
+
+    def __len__(self) -> int:
+        """Return number of indexed values."""
+        return len(self._table._indexes[self._field])
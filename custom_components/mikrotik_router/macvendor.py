@@ -0,0 +1,197 @@
+"""MAC vendor cache for Mikrotik Router."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import time
+
+from mac_vendor_lookup import AsyncMacLookup
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_MAC_VENDORS = "mac_vendors"
+STORAGE_KEY = f"{DOMAIN}.mac_vendors"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+# Seconds before an OUI missing from the vendor list is looked up again
+MISS_EXPIRY = 7 * 24 * 60 * 60
+
+
+# ---------------------------
+#   get_oui
+# ---------------------------
+def get_oui(mac) -> str | None:
+    """Return OUI prefix of MAC address, None if it has no vendor.
+
+    Locally administered addresses, which includes randomized addresses,
+    are not assigned by a vendor and never resolve.
+    """
+    oui = mac.replace(":", "").replace("-", "").replace(".", "").upper()[:6]
+    try:
+        if len(oui) < 6 or int(oui, 16) >> 16 & 0x02:
+            return None
+    except ValueError:
+        return None
+
+    return oui
+
+
+# ---------------------------
+#   get_mac_vendor_cache
+# ---------------------------
+def get_mac_vendor_cache(hass: HomeAssistant) -> MacVendorCache:
+    """Return the cache shared by all config entries."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_MAC_VENDORS not in data:
+        data[DATA_MAC_VENDORS] = MacVendorCache(hass)
+
+    return data[DATA_MAC_VENDORS]
+
+
+# ---------------------------
+#   load_oui_table
+# ---------------------------
+def load_oui_table() -> dict | None:
+    """Read and parse the local OUI list, None if there is none."""
+    location = AsyncMacLookup().find_vendors_list()
+    if not location:
+        return None
+
+    prefixes = {}
+    with open(location, "rb") as file:
+        for line in file.read().splitlines():
+            prefix, _, vendor = line.partition(b":")
+            prefixes[prefix] = vendor
+
+    return prefixes
+
+
+# ---------------------------
+#   MacVendorCache
+# ---------------------------
+class MacVendorCache:
+    """Manufacturer cache by OUI prefix, persisted in HA storage.
+
+    OUIs missing from the vendor list are remembered for MISS_EXPIRY
+    seconds, so they are not looked up on every restart but are found
+    once a newer list has them.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize cache."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._lock = asyncio.Lock()
+        self._prefixes = None
+        self._vendors = None
+        self._misses = None
+
+    # ---------------------------
+    #   async_load
+    # ---------------------------
+    async def async_load(self) -> None:
+        """Load cached vendors from storage."""
+        if self._vendors is not None:
+            return
+
+        data = await self._store.async_load() or {}
+        # Misses were stored as empty vendors before they expired
+        self._vendors = {
+            oui: vendor for oui, vendor in data.get("vendors", {}).items() if vendor
+        }
+        self._misses = data.get("misses", {})
+        _LOGGER.debug("Loaded %s cached MAC vendors", len(self._vendors))
+
+    # ---------------------------
+    #   async_resolve
+    # ---------------------------
+    async def async_resolve(self, macs) -> dict:
+        """Return manufacturer for each MAC address, empty if unknown.
+
+        OUIs missing from the cache are resolved in one executor pass
+        against the OUI table.
+        """
+        async with self._lock:
+            await self.async_load()
+            ouis = {mac: get_oui(mac) for mac in macs}
+            now = time()
+            pending = {
+                oui
+                for oui in ouis.values()
+                if oui
+                and oui not in self._vendors
+                and now - self._misses.get(oui, 0) >= MISS_EXPIRY
+            }
+            if pending:
+                await self._async_resolve_pending(pending)
+
+        return {
+            mac: self._vendors.get(oui, "") if oui else "" for mac, oui in ouis.items()
+        }
+
+    # ---------------------------
+    #   _async_resolve_pending
+    # ---------------------------
+    async def _async_resolve_pending(self, pending) -> None:
+        """Resolve uncached OUIs and schedule a save."""
+        try:
+            if self._prefixes is None:
+                self._prefixes = await self.hass.async_add_executor_job(load_oui_table)
+
+            if self._prefixes is None:
+                # No local list yet, download it once
+                lookup = AsyncMacLookup()
+                await lookup.update_vendors()
+                self._prefixes = lookup.prefixes
+        except Exception as err:
+            _LOGGER.warning("Unable to load MAC vendor list: %s", err)
+
+        if not self._prefixes:
+            # Not cached, the OUI table may be available next time
+            self._prefixes = None
+            return
+
+        resolved = await self.hass.async_add_executor_job(
+            self._resolve, self._prefixes, pending
+        )
+        now = time()
+        for oui, vendor in resolved.items():
+            if vendor:
+                self._vendors[oui] = vendor
+                self._misses.pop(oui, None)
+            else:
+                self._misses[oui] = now
+
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        _LOGGER.debug(
+            "Resolved %s MAC vendors, %s unknown",
+            len(resolved),
+            sum(1 for vendor in resolved.values() if not vendor),
+        )
+
+    # ---------------------------
+    #   _resolve
+    # ---------------------------
+    @staticmethod
+    def _resolve(prefixes, ouis) -> dict:
+        """Return vendor for each OUI from the OUI table."""
+        resolved = {}
+        for oui in ouis:
+            vendor = prefixes.get(oui.encode())
+            resolved[oui] = vendor.decode("utf8", "replace") if vendor else ""
+
+        return resolved
+
+    # ---------------------------
+    #   _data_to_save
+    # ---------------------------
+    def _data_to_save(self) -> dict:
+        """Return data for storage."""
+        return {"vendors": self._vendors, "misses": self._misses}
@@ -1,17 +1,18 @@
 """Mikrotik API for Mikrotik Router."""
 
+import asyncio
 import logging
 import ssl
+from contextlib import aclosing
 from time import time
-from threading import Lock
 from voluptuous import Optional
+from .apiprotocol import ApiConnection, compose_query, compose_words
+from .exceptions import ApiTrapError
 from .const import (
     DEFAULT_LOGIN_METHOD,
     DEFAULT_ENCODING,
 )
 
-import librouteros
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -41,8 +42,8 @@ class MikrotikAPI:
         self._password = password
         self._login_method = login_method
         self._encoding = encoding
-        self._ssl_wrapper = None
-        self.lock = Lock()
+        self._ssl_context = None
+        self.lock = asyncio.Lock()
 
         self._connection = None
         self._connected = False
@@ -72,13 +73,13 @@ class MikrotikAPI:
     # ---------------------------
     #   connection_check
     # ---------------------------
-    def connection_check(self) -> bool:
+    async def connection_check(self) -> bool:
         """Check if mikrotik is connected"""
         if not self._connected or not self._connection:
             if self._connection_epoch > time() - self._connection_retry_sec:
                 return False
 
-            if not self.connect():
+            if not await self.connect():
                 return False
 
         return True
@@ -101,52 +102,84 @@ class MikrotikAPI:
 
             self.connection_error_reported = True
 
+        if self._connection:
+            self._connection.close()
+
         self._reconnected = False
         self._connected = False
         self._connection = None
         self._connection_epoch = 0
 
+    # ---------------------------
+    #   close
+    # ---------------------------
+    def close(self) -> None:
+        """Close connection to Mikrotik device."""
+        if self._connection:
+            self._connection.close()
+
+        self._connected = False
+        self._connection = None
+
+    # ---------------------------
+    #   _create_ssl_context
+    # ---------------------------
+    def _create_ssl_context(self) -> ssl.SSLContext:
+        """Create SSL context, loads certificates from disk."""
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        if self._ssl_verify:
+            ssl_context.verify_mode = ssl.CERT_REQUIRED
+            ssl_context.verify_flags &= ~ssl.VERIFY_X509_STRICT
+        else:
+            ssl_context.verify_mode = ssl.CERT_NONE
+
+        return ssl_context
+
     # ---------------------------
     #   connect
     # ---------------------------
-    def connect(self) -> bool:
+    async def connect(self) -> bool:
         """Connect to Mikrotik device."""
-        self.error = ""
-        self._connected = False
-        self._connection_epoch = time()
+        async with self.lock:
+            # Concurrent callers wait for the first connection attempt
+            if self._connected and self._connection:
+                return True
 
-        kwargs = {
-            "encoding": self._encoding,
-            "login_methods": self._login_method,
-            "port": self._port,
-        }
+            self.error = ""
+            self._connected = False
+            self._connection_epoch = time()
+            try:
+                if self._use_ssl and self._ssl_context is None:
+                    self._ssl_context = (
+                        await asyncio.get_running_loop().run_in_executor(
+                            None, self._create_ssl_context
+                        )
+                    )
+
+                self._connection = await ApiConnection.open(
+                    self._host,
+                    self._port,
+                    ssl_context=self._ssl_context if self._use_ssl else None,
+                    encoding=self._encoding,
+                )
+                await self._connection.login(
+                    self._username, self._password, self._login_method
+                )
+            except Exception as e:
+                if not self.connection_error_reported:
+                    _LOGGER.error(
+                        "Mikrotik %s error while connecting: %s", self._host, e
+                    )
+                    self.connection_error_reported = True
 
-        self.lock.acquire()
-        try:
-            if self._use_ssl:
-                if self._ssl_wrapper is None:
-                    ssl_context = ssl.create_default_context()
-                    ssl_context.check_hostname = False
-                    if self._ssl_verify:
-                        ssl_context.verify_mode = ssl.CERT_REQUIRED
-                        ssl_context.verify_flags &= ~ssl.VERIFY_X509_STRICT
-                    else:
-                        ssl_context.verify_mode = ssl.CERT_NONE
-                    self._ssl_wrapper = ssl_context.wrap_socket
-                kwargs["ssl_wrapper"] = self._ssl_wrapper
-            self._connection = librouteros.connect(
-                self._host, self._username, self._password, **kwargs
-            )
-        except Exception as e:
-            if not self.connection_error_reported:
-                _LOGGER.error("Mikrotik %s error while connecting: %s", self._host, e)
-                self.connection_error_reported = True
+                self.error_to_strings(f"{e}")
+                if self._connection:
+                    self._connection.close()
+
+                self._connection = None
+                return False
 
-            self.error_to_strings(f"{e}")
-            self._connection = None
-            self.lock.release()
-            return False
-        else:
             if self.connection_error_reported:
                 _LOGGER.warning("Mikrotik Reconnected to %s", self._host)
                 self.connection_error_reported = False
@@ -155,7 +188,6 @@ class MikrotikAPI:
 
             self._connected = True
             self._reconnected = True
-            self.lock.release()
 
         return self._connected
 
@@ -182,68 +214,124 @@ class MikrotikAPI:
         return self._connected
 
     # ---------------------------
-    #   query
+    #   _command
     # ---------------------------
-    def query(self, path, command=None, args=None, return_list=True) -> Optional(list):
-        """Retrieve data from Mikrotik API."""
-        """Returns generator object, unless return_list passed as True"""
-        if path == "/system/health" and self.disable_health:
-            return None
-
-        if args is None:
-            args = {}
-
-        if not self.connection_check():
+    async def _command(self, location, cmd, args=None, query=None) -> Optional(list):
+        """Send command to Mikrotik API, disconnect on failure."""
+        connection = self._connection
+        if not connection:
             return None
 
-        self.lock.acquire()
         try:
-            _LOGGER.debug("API query: %s", path)
-            response = self._connection.path(path)
+            return await connection.command(
+                cmd, compose_words(args or {}) + (query or [])
+            )
         except Exception as e:
-            self.disconnect("path", e)
-            self.lock.release()
+            self._command_failed(connection, location, cmd, e)
             return None
 
-        if response and return_list and not command:
-            try:
-                response = list(response)
-            except Exception as e:
-                if path == "/system/health" and "no such command prefix" in str(e):
-                    self.disable_health = True
-                    self.lock.release()
-                    return None
+    # ---------------------------
+    #   _command_failed
+    # ---------------------------
+    def _command_failed(self, connection, location, cmd, error) -> None:
+        """Handle failed command, disconnect on connection errors.
+
+        A trap only fails this command, the session stays usable.
+        """
+        if cmd == "/system/health/print" and "no such command prefix" in str(error):
+            self.disable_health = True
+            return
+
+        if isinstance(error, ApiTrapError):
+            _LOGGER.warning(
+                "Mikrotik %s error while %s : %s", self._host, location, error
+            )
+            return
+
+        # Do not drop a session established while this command was failing
+        if connection is self._connection:
+            self.disconnect(location, error)
 
-                self.disconnect(f"building list for path {path}", e)
-                self.lock.release()
-                return None
+    # ---------------------------
+    #   query
+    # ---------------------------
+    async def query(
+        self, path, command=None, args=None, proplist=None, only=None, skip=None
+    ) -> Optional(list):
+        """Retrieve data from Mikrotik API, None on failure.
+
+        Print queries are limited to proplist fields and filtered on the
+        router with parse_api style only and skip filters.
+        """
+        if path == "/system/health" and self.disable_health:
+            return None
+
+        if not await self.connection_check():
+            return None
 
-        elif response and command:
+        if command:
             _LOGGER.debug("API query: %s, %s, %s", path, command, args)
-            try:
-                response = list(response(command, **args))
-            except Exception as e:
-                self.disconnect("path", e)
-                self.lock.release()
-                return None
+            response = await self._command("path", f"{path}/{command}", args)
+        else:
+            query = compose_query(only, skip)
+            _LOGGER.debug("API query: %s, %s, %s", path, proplist, query)
+            response = await self._command(
+                f"building list for path {path}",
+                f"{path}/print",
+                {".proplist": ",".join(proplist)} if proplist else None,
+                query,
+            )
 
-        self.lock.release()
-        return response or None
+        return response
 
     # ---------------------------
-    #   set_value
+    #   query_stream
     # ---------------------------
-    def set_value(self, path, param, value, mod_param, mod_value) -> bool:
-        """Modify a parameter"""
-        entry_found = None
+    async def query_stream(
+        self, path, proplist=None, only=None, skip=None, errors=None
+    ):
+        """Yield print rows from Mikrotik API as they are received.
 
-        if not self.connection_check():
-            return False
+        Iteration stops early on failure. A stream is complete when
+        connected() is true and no error was appended to errors.
+        """
+        if path == "/system/health" and self.disable_health:
+            return
+
+        if not await self.connection_check():
+            return
+
+        connection = self._connection
+        if not connection:
+            return
+
+        cmd = f"{path}/print"
+        query = compose_query(only, skip)
+        _LOGGER.debug("API query: %s, %s, %s", path, proplist, query)
+        words = (
+            compose_words({".proplist": ",".join(proplist)} if proplist else {}) + query
+        )
+        try:
+            # Closing this generator early closes the stream, which cancels it
+            async with aclosing(connection.stream(cmd, words)) as stream:
+                async for entry in stream:
+                    yield entry
+        except Exception as e:
+            if errors is not None:
+                errors.append(e)
 
-        response = self.query(path, return_list=False)
+            self._command_failed(connection, f"building list for path {path}", cmd, e)
+
+    # ---------------------------
+    #   _find_id
+    # ---------------------------
+    async def _find_id(self, path, param, value) -> Optional(str):
+        """Find .id of entry with matching parameter value"""
+        response = await self._command("path", f"{path}/print")
         if response is None:
-            return False
+            return None
 
+        entry_found = None
         for tmp in response:
             if param not in tmp:
                 continue
@@ -253,6 +341,20 @@ class MikrotikAPI:
 
             entry_found = tmp[".id"]
 
+        return entry_found or ""
+
+    # ---------------------------
+    #   set_value
+    # ---------------------------
+    async def set_value(self, path, param, value, mod_param, mod_value) -> bool:
+        """Modify a parameter"""
+        if not await self.connection_check():
+            return False
+
+        entry_found = await self._find_id(path, param, value)
+        if entry_found is None:
+            return False
+
         if not entry_found:
             _LOGGER.error(
                 "Mikrotik %s set_value parameter %s with value %s not found",
@@ -263,41 +365,22 @@ class MikrotikAPI:
             return True
 
         params = {".id": entry_found, mod_param: mod_value}
-        self.lock.acquire()
-        try:
-            response.update(**params)
-        except Exception as e:
-            self.disconnect("set_value", e)
-            self.lock.release()
-            return False
-
-        self.lock.release()
-        return True
+        return await self._command("set_value", f"{path}/set", params) is not None
 
     # ---------------------------
     #   execute
     # ---------------------------
-    def execute(self, path, command, param, value, attributes=None) -> bool:
+    async def execute(self, path, command, param, value, attributes=None) -> bool:
         """Execute a command"""
-        entry_found = None
         params = {}
 
-        if not self.connection_check():
-            return False
-
-        response = self.query(path, return_list=False)
-        if response is None:
+        if not await self.connection_check():
             return False
 
         if param:
-            for tmp in response:
-                if param not in tmp:
-                    continue
-
-                if tmp[param] != value:
-                    continue
-
-                entry_found = tmp[".id"]
+            entry_found = await self._find_id(path, param, value)
+            if entry_found is None:
+                return False
 
             if not entry_found:
                 _LOGGER.error(
@@ -314,65 +397,37 @@ class MikrotikAPI:
         if attributes:
             params.update(attributes)
 
-        self.lock.acquire()
-        try:
-            tuple(response(command, **params))
-        except Exception as e:
-            self.disconnect("execute", e)
-            self.lock.release()
-            return False
-
-        self.lock.release()
-        return True
+        return await self._command("execute", f"{path}/{command}", params) is not None
 
     # ---------------------------
     #   run_script
     # ---------------------------
-    def run_script(self, name) -> bool:
+    async def run_script(self, name) -> bool:
         """Run script"""
-        entry_found = None
-        if not self.connection_check():
+        if not await self.connection_check():
             return False
 
-        response = self.query("/system/script", return_list=False)
-        if response is None:
+        entry_found = await self._find_id("/system/script", "name", name)
+        if entry_found is None:
             return False
 
-        self.lock.acquire()
-        for tmp in response:
-            if "name" not in tmp:
-                continue
-
-            if tmp["name"] != name:
-                continue
-
-            entry_found = tmp[".id"]
-
         if not entry_found:
             _LOGGER.error("Mikrotik %s Script %s not found", self._host, name)
             return True
 
-        try:
-            run = response("run", **{".id": entry_found})
-            tuple(run)
-        except Exception as e:
-            self.disconnect("run_script", e)
-            self.lock.release()
-            return False
-
-        self.lock.release()
-        return True
+        return (
+            await self._command(
+                "run_script", "/system/script/run", {".id": entry_found}
+            )
+            is not None
+        )
 
     # ---------------------------
     #   arp_ping
     # ---------------------------
-    def arp_ping(self, address, interface) -> bool:
+    async def arp_ping(self, address, interface) -> bool:
         """Check arp ping response traffic stats"""
-        if not self.connection_check():
-            return False
-
-        response = self.query("/ping", return_list=False)
-        if response is None:
+        if not await self.connection_check():
             return False
 
         args = {
@@ -382,24 +437,10 @@ class MikrotikAPI:
             "interface": interface,
             "address": address,
         }
-        self.lock.acquire()
-        try:
-            # _LOGGER.debug("Ping host query: %s", args["address"])
-            ping = response("/ping", **args)
-        except Exception as e:
-            self.disconnect("arp_ping", e)
-            self.lock.release()
-            return False
-
-        try:
-            ping = list(ping)
-        except Exception as e:
-            self.disconnect("arp_ping", e)
-            self.lock.release()
+        ping = await self._command("arp_ping", "/ping", args)
+        if ping is None:
             return False
 
-        self.lock.release()
-
         for tmp in ping:
             if "received" in tmp and tmp["received"] > 0:
                 _LOGGER.debug("Ping host success: %s", args["address"])
@@ -412,15 +453,15 @@ class MikrotikAPI:
     def _current_milliseconds():
         return int(round(time() * 1000))
 
-    def is_accounting_and_local_traffic_enabled(self) -> (bool, bool):
+    async def is_accounting_and_local_traffic_enabled(self) -> (bool, bool):
         # Returns:
         #   1st bool: Is accounting enabled
         #   2nd bool: Is account-local-traffic enabled
 
-        if not self.connection_check():
+        if not await self.connection_check():
             return False, False
 
-        response = self.query("/ip/accounting")
+        response = await self.query("/ip/accounting")
         if response is None:
             return False, False
 
@@ -442,32 +483,20 @@ class MikrotikAPI:
     #   take_client_traffic_snapshot
     #   Returns float -> period in seconds between last and current run
     # ---------------------------
-    def take_client_traffic_snapshot(self, use_accounting) -> float:
+    async def take_client_traffic_snapshot(self, use_accounting) -> float:
         """Tako accounting snapshot and return time diff"""
-        if not self.connection_check():
+        if not await self.connection_check():
             return 0
 
         if use_accounting:
-            accounting = self.query("/ip/accounting", return_list=False)
-
-            self.lock.acquire()
-            try:
-                # Prepare command
-                take = accounting("snapshot/take")
-            except Exception as e:
-                self.disconnect("accounting_snapshot", e)
-                self.lock.release()
-                return 0
-
-            try:
-                list(take)
-            except Exception as e:
-                self.disconnect("accounting_snapshot", e)
-                self.lock.release()
+            if (
+                await self._command(
+                    "accounting_snapshot", "/ip/accounting/snapshot/take"
+                )
+                is None
+            ):
                 return 0
 
-            self.lock.release()
-
         # First request will be discarded because we cannot know when the last data was retrieved
         # prevents spikes in data
         if not self.client_traffic_last_run:
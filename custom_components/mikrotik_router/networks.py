@@ -0,0 +1,100 @@
+"""Local network classification for Mikrotik Router."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from ipaddress import ip_address, ip_network
+
+
+# ---------------------------
+#   NetworkClassifier
+# ---------------------------
+class NetworkClassifier:
+    """Longest prefix match of addresses against a set of networks.
+
+    Networks are flattened into sorted, non-overlapping ranges, each
+    owned by the most specific network covering it, so a lookup is a
+    single binary search. IPv4 and IPv6 are kept in separate tables.
+    """
+
+    def __init__(self, networks=()):
+        """Build range tables from IPv4/IPv6 networks or their strings."""
+        networks = [
+            ip_network(net) if isinstance(net, str) else net for net in networks
+        ]
+        self.networks = list(dict.fromkeys(networks))
+        self._tables = {
+            version: self._build(
+                [net for net in self.networks if net.version == version]
+            )
+            for version in (4, 6)
+        }
+
+    # ---------------------------
+    #   _build
+    # ---------------------------
+    @staticmethod
+    def _build(networks) -> tuple:
+        """Return range starts and owning networks, None for gaps."""
+        bounds = sorted(
+            {int(net.network_address) for net in networks}
+            | {int(net.broadcast_address) + 1 for net in networks}
+        )
+        starts = []
+        owners = []
+        for start in bounds:
+            owner = None
+            for net in networks:
+                if int(net.network_address) <= start <= int(net.broadcast_address) and (
+                    owner is None or net.prefixlen > owner.prefixlen
+                ):
+                    owner = net
+
+            if owners and owners[-1] == owner:
+                continue
+
+            starts.append(start)
+            owners.append(owner)
+
+        return starts, owners
+
+    # ---------------------------
+    #   lookup_int
+    # ---------------------------
+    def lookup_int(self, value, version=4):
+        """Return most specific network containing integer address."""
+        starts, owners = self._tables[version]
+        idx = bisect_right(starts, value) - 1
+        return owners[idx] if idx >= 0 else None
+
+    # ---------------------------
+    #   lookup
+    # ---------------------------
+    def lookup(self, address):
+        """Return most specific network containing address, None if none.
+
+        Invalid addresses are not in any network.
+        """
+        if isinstance(address, str):
+            try:
+                address = ip_address(address)
+            except ValueError:
+                return None
+
+        return self.lookup_int(int(address), address.version)
+
+    # ---------------------------
+    #   ranges
+    # ---------------------------
+    def ranges(self, version=4) -> tuple:
+        """Return sorted range starts and whether each range is local."""
+        starts, owners = self._tables[version]
+        return starts, [owner is not None for owner in owners]
+
+    def __contains__(self, address) -> bool:
+        """Return True if address is in any network."""
+        return self.lookup(address) is not None
+
+    def __bool__(self) -> bool:
+        """Return True if there are any networks."""
+        return bool(self.networks)
@@ -0,0 +1,94 @@
+"""Update cycle scheduler for Mikrotik Router."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from logging import getLogger
+
+_LOGGER = getLogger(__name__)
+
+
+# ---------------------------
+#   Stage
+# ---------------------------
+@dataclass
+class Stage:
+    """Single collector in the update cycle.
+
+    reads and writes name the ds keys the collector depends on and updates.
+    Stages with a tier only run on cycles where that tier is due.
+    """
+
+    name: str
+    func: Callable[[], Awaitable[None]]
+    reads: tuple = ()
+    writes: tuple = ()
+    enabled: bool = True
+    tier: str | None = None
+
+
+# ---------------------------
+#   build_dependencies
+# ---------------------------
+def build_dependencies(stages) -> dict:
+    """Return prerequisite stage names for every stage.
+
+    A stage waits for every earlier stage it conflicts with, so declaration
+    order decides who goes first whenever two stages touch the same key.
+    """
+    deps = {}
+    for idx, stage in enumerate(stages):
+        touched = set(stage.reads) | set(stage.writes)
+        deps[stage.name] = [
+            prev.name
+            for prev in stages[:idx]
+            if set(prev.writes) & touched or set(prev.reads) & set(stage.writes)
+        ]
+
+    return deps
+
+
+# ---------------------------
+#   async_run_stages
+# ---------------------------
+async def async_run_stages(stages, connected, tiers=()) -> None:
+    """Run stages concurrently, respecting their declared dependencies.
+
+    Only untiered stages and stages of a due tier are run. Stages are
+    skipped once connected() turns false. The first exception cancels
+    everything still running and is raised to the caller.
+    """
+    stages = [
+        stage
+        for stage in stages
+        if stage.enabled and (stage.tier is None or stage.tier in tiers)
+    ]
+    deps = build_dependencies(stages)
+    tasks = {}
+
+    async def _run(stage, prerequisites):
+        if prerequisites:
+            await asyncio.gather(*prerequisites)
+
+        if not connected():
+            _LOGGER.debug("Skipping stage %s, not connected", stage.name)
+            return
+
+        await stage.func()
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.create_task(
+            _run(stage, [tasks[name] for name in deps[stage.name]]),
+            name=f"mikrotik_router {stage.name}",
+        )
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
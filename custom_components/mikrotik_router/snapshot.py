@@ -0,0 +1,147 @@
+"""Warm-start snapshots of Mikrotik Router data."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+
+from homeassistant.util.dt import parse_datetime
+
+# Tables rebuilt on every start, their derived state follows change tracking
+SNAPSHOT_SKIP = ("dns", "dhcp-network", "host_hass")
+
+# Counters and rates reset on restore, so the first live cycle starts clean
+SNAPSHOT_VOLATILE = {
+    "interface": {
+        "rx": 0.0,
+        "tx": 0.0,
+        "rx-previous": 0.0,
+        "tx-previous": 0.0,
+    },
+    "client_traffic": {
+        "wan-tx": 0.0,
+        "wan-rx": 0.0,
+        "lan-tx": 0.0,
+        "lan-rx": 0.0,
+        "tx": 0.0,
+        "rx": 0.0,
+        "previous-bytes-up": 0.0,
+        "previous-bytes-down": 0.0,
+    },
+}
+
+DATETIME_TAG = "__datetime__"
+NATIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+CONTAINER_TYPES = frozenset((dict, list))
+SKIP = object()
+
+
+# ---------------------------
+#   copy_snapshot
+# ---------------------------
+def copy_snapshot(ds) -> dict:
+    """Return copy of the data store tables to snapshot.
+
+    Rows are copied one level deep, so the copy can be encoded with
+    dump_snapshot in the executor while the data store is updated.
+    """
+    return {
+        name: (
+            {
+                uid: dict(row) if isinstance(row, Mapping) else row
+                for uid, row in table.items()
+            }
+            if isinstance(table, Mapping)
+            else list(table)
+        )
+        for name, table in ds.items()
+        if name not in SNAPSHOT_SKIP
+    }
+
+
+# ---------------------------
+#   dump_snapshot
+# ---------------------------
+def dump_snapshot(tables) -> dict:
+    """Return JSON serializable snapshot of copy_snapshot tables.
+
+    Rows are stored as plain dicts, fields with values that cannot be
+    serialized are left out.
+    """
+    snapshot = {}
+    for name, table in tables.items():
+        snapshot[name] = encode_value(table)
+        if volatile := SNAPSHOT_VOLATILE.get(name):
+            for row in snapshot[name].values():
+                for key in volatile.keys() & row.keys():
+                    row[key] = volatile[key]
+
+    return snapshot
+
+
+# ---------------------------
+#   load_snapshot
+# ---------------------------
+def load_snapshot(ds, snapshot) -> None:
+    """Restore data store tables from snapshot in place."""
+    for name, table in snapshot.items():
+        if name not in ds or name in SNAPSHOT_SKIP:
+            continue
+
+        table = decode_value(table)
+        if isinstance(ds[name], dict) and isinstance(table, dict):
+            ds[name].update(table)
+        else:
+            ds[name] = table
+
+
+# ---------------------------
+#   encode_value
+# ---------------------------
+def encode_value(value):
+    """Return value with datetimes tagged and rows as plain dicts.
+
+    Values that cannot be serialized are returned as SKIP.
+    """
+    if type(value) in NATIVE_TYPES:
+        return value
+
+    if isinstance(value, datetime):
+        return {DATETIME_TAG: value.isoformat()}
+
+    if isinstance(value, Mapping):
+        encoded = {}
+        for key, val in value.items():
+            if type(val) not in NATIVE_TYPES:
+                val = encode_value(val)
+                if val is SKIP:
+                    continue
+
+            encoded[key] = val
+
+        return encoded
+
+    if isinstance(value, (list, tuple)):
+        return [val for val in map(encode_value, value) if val is not SKIP]
+
+    return SKIP
+
+
+# ---------------------------
+#   decode_value
+# ---------------------------
+def decode_value(value):
+    """Reverse encode_value."""
+    if isinstance(value, dict):
+        if DATETIME_TAG in value:
+            return parse_datetime(value[DATETIME_TAG])
+
+        return {
+            key: decode_value(val) if type(val) in CONTAINER_TYPES else val
+            for key, val in value.items()
+        }
+
+    if isinstance(value, list):
+        return [decode_value(val) for val in value]
+
+    return value
@@ -82,7 +82,7 @@ class MikrotikSwitch(MikrotikEntity, SwitchEntity, RestoreEntity):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.coordinator.async_set_value(path, param, value, mod_param, False)
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -94,7 +94,7 @@ class MikrotikSwitch(MikrotikEntity, SwitchEntity, RestoreEntity):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.coordinator.async_set_value(path, param, value, mod_param, True)
         await self.coordinator.async_refresh()
 
 
@@ -153,11 +153,13 @@ class MikrotikPortSwitch(MikrotikSwitch):
             param = "name"
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.coordinator.async_set_value(path, param, value, mod_param, False)
 
         if "poe-out" in self._data and self._data["poe-out"] == "off":
             path = "/interface/ethernet"
-            self.coordinator.set_value(path, param, value, "poe-out", "auto-on")
+            await self.coordinator.async_set_value(
+                path, param, value, "poe-out", "auto-on"
+            )
 
         await self.coordinator.async_refresh()
 
@@ -175,11 +177,11 @@ class MikrotikPortSwitch(MikrotikSwitch):
             param = "name"
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.coordinator.async_set_value(path, param, value, mod_param, True)
 
         if "poe-out" in self._data and self._data["poe-out"] == "auto-on":
             path = "/interface/ethernet"
-            self.coordinator.set_value(path, param, value, "poe-out", "off")
+            await self.coordinator.async_set_value(path, param, value, "poe-out", "off")
 
         await self.coordinator.async_refresh()
 
@@ -198,16 +200,19 @@ class MikrotikNATSwitch(MikrotikSwitch):
         path = self.entity_description.data_switch_path
         param = ".id"
         value = None
-        for uid in self.coordinator.data["nat"]:
-            if self.coordinator.data["nat"][uid]["uniq-id"] == (
+        uid = self.coordinator.data["nat"].find(
+            "uniq-id",
+            (
                 f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
                 f"{self._data['in-interface']}:{self._data['dst-port']}-"
                 f"{self._data['out-interface']}:{self._data['to-addresses']}:{self._data['to-ports']}"
-            ):
-                value = self.coordinator.data["nat"][uid][".id"]
+            ),
+        )
+        if uid is not None:
+            value = self.coordinator.data["nat"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.coordinator.async_set_value(path, param, value, mod_param, False)
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -218,16 +223,19 @@ class MikrotikNATSwitch(MikrotikSwitch):
         path = self.entity_description.data_switch_path
         param = ".id"
         value = None
-        for uid in self.coordinator.data["nat"]:
-            if self.coordinator.data["nat"][uid]["uniq-id"] == (
+        uid = self.coordinator.data["nat"].find(
+            "uniq-id",
+            (
                 f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
                 f"{self._data['in-interface']}:{self._data['dst-port']}-"
                 f"{self._data['out-interface']}:{self._data['to-addresses']}:{self._data['to-ports']}"
-            ):
-                value = self.coordinator.data["nat"][uid][".id"]
+            ),
+        )
+        if uid is not None:
+            value = self.coordinator.data["nat"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.coordinator.async_set_value(path, param, value, mod_param, True)
         await self.coordinator.async_refresh()
 
 
@@ -245,17 +253,20 @@ class MikrotikMangleSwitch(MikrotikSwitch):
         path = self.entity_description.data_switch_path
         param = ".id"
         value = None
-        for uid in self.coordinator.data["mangle"]:
-            if self.coordinator.data["mangle"][uid]["uniq-id"] == (
+        uid = self.coordinator.data["mangle"].find(
+            "uniq-id",
+            (
                 f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
                 f"{self._data['src-address']}:{self._data['src-port']}-"
                 f"{self._data['dst-address']}:{self._data['dst-port']},"
                 f"{self._data['src-address-list']}-{self._data['dst-address-list']}"
-            ):
-                value = self.coordinator.data["mangle"][uid][".id"]
+            ),
+        )
+        if uid is not None:
+            value = self.coordinator.data["mangle"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.coordinator.async_set_value(path, param, value, mod_param, False)
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -266,17 +277,20 @@ class MikrotikMangleSwitch(MikrotikSwitch):
         path = self.entity_description.data_switch_path
         param = ".id"
         value = None
-        for uid in self.coordinator.data["mangle"]:
-            if self.coordinator.data["mangle"][uid]["uniq-id"] == (
+        uid = self.coordinator.data["mangle"].find(
+            "uniq-id",
+            (
                 f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
                 f"{self._data['src-address']}:{self._data['src-port']}-"
                 f"{self._data['dst-address']}:{self._data['dst-port']},"
                 f"{self._data['src-address-list']}-{self._data['dst-address-list']}"
-            ):
-                value = self.coordinator.data["mangle"][uid][".id"]
+            ),
+        )
+        if uid is not None:
+            value = self.coordinator.data["mangle"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.coordinator.async_set_value(path, param, value, mod_param, True)
         await self.coordinator.async_refresh()
 
 
@@ -294,16 +308,19 @@ class MikrotikFilterSwitch(MikrotikSwitch):
         path = self.entity_description.data_switch_path
         param = ".id"
         value = None
-        for uid in self.coordinator.data["filter"]:
-            if self.coordinator.data["filter"][uid]["uniq-id"] == (
+        uid = self.coordinator.data["filter"].find(
+            "uniq-id",
+            (
                 f"{self._data['chain']},{self._data['action']},{self._data['protocol']},{self._data['layer7-protocol']},"
                 f"{self._data['in-interface']},{self._data['in-interface-list']}:{self._data['src-address']},{self._data['src-address-list']}:{self._data['src-port']}-"
                 f"{self._data['out-interface']},{self._data['out-interface-list']}:{self._data['dst-address']},{self._data['dst-address-list']}:{self._data['dst-port']}"
-            ):
-                value = self.coordinator.data["filter"][uid][".id"]
+            ),
+        )
+        if uid is not None:
+            value = self.coordinator.data["filter"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.coordinator.async_set_value(path, param, value, mod_param, False)
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -314,16 +331,19 @@ class MikrotikFilterSwitch(MikrotikSwitch):
         path = self.entity_description.data_switch_path
         param = ".id"
         value = None
-        for uid in self.coordinator.data["filter"]:
-            if self.coordinator.data["filter"][uid]["uniq-id"] == (
+        uid = self.coordinator.data["filter"].find(
+            "uniq-id",
+            (
                 f"{self._data['chain']},{self._data['action']},{self._data['protocol']},{self._data['layer7-protocol']},"
                 f"{self._data['in-interface']},{self._data['in-interface-list']}:{self._data['src-address']},{self._data['src-address-list']}:{self._data['src-port']}-"
                 f"{self._data['out-interface']},{self._data['out-interface-list']}:{self._data['dst-address']},{self._data['dst-address-list']}:{self._data['dst-port']}"
-            ):
-                value = self.coordinator.data["filter"][uid][".id"]
+            ),
+        )
+        if uid is not None:
+            value = self.coordinator.data["filter"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.coordinator.async_set_value(path, param, value, mod_param, True)
         await self.coordinator.async_refresh()
 
 
@@ -346,7 +366,7 @@ class MikrotikQueueSwitch(MikrotikSwitch):
                 value = self.coordinator.data["queue"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.coordinator.async_set_value(path, param, value, mod_param, False)
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -362,7 +382,7 @@ class MikrotikQueueSwitch(MikrotikSwitch):
                 value = self.coordinator.data["queue"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.coordinator.async_set_value(path, param, value, mod_param, True)
         await self.coordinator.async_refresh()
 
 
@@ -381,7 +401,7 @@ class MikrotikKidcontrolPauseSwitch(MikrotikSwitch):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         command = "resume"
-        self.coordinator.execute(path, command, param, value)
+        await self.coordinator.async_execute(path, command, param, value)
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -393,5 +413,5 @@ class MikrotikKidcontrolPauseSwitch(MikrotikSwitch):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         command = "pause"
-        self.coordinator.execute(path, command, param, value)
+        await self.coordinator.async_execute(path, command, param, value)
         await self.coordinator.async_refresh()
@@ -0,0 +1,167 @@
+"""Benchmark accounting snapshot aggregation.
+
+Usage: python scripts/bench_accounting.py [--rows N ...]
+
+Compares the per-row loop that process_accounting used before
+aggregate_traffic with the pure Python and NumPy paths of
+aggregate_traffic, on 10k and 100k row synthetic snapshots by default.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from ipaddress import IPv4Network, ip_address
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.mikrotik_router import accounting  # noqa: E402
+from custom_components.mikrotik_router.networks import NetworkClassifier  # noqa: E402
+
+NETWORKS = [
+    IPv4Network("192.168.88.0/24"),
+    IPv4Network("10.10.0.0/16"),
+    IPv4Network("172.16.5.0/24"),
+]
+HOSTS = [f"192.168.88.{i}" for i in range(2, 250)] + [
+    f"10.10.{i // 250}.{i % 250 + 1}" for i in range(1000)
+]
+
+
+# ---------------------------
+#   make_snapshot
+# ---------------------------
+def make_snapshot(rows) -> list:
+    """Return synthetic accounting snapshot rows."""
+    rnd = random.Random(2)
+
+    def local():
+        if rnd.random() < 0.9:
+            return rnd.choice(HOSTS)
+
+        return f"10.10.99.{rnd.randrange(1, 250)}"
+
+    def wan():
+        return ".".join(
+            str(part)
+            for part in (
+                rnd.randrange(1, 223),
+                rnd.randrange(256),
+                rnd.randrange(256),
+                rnd.randrange(1, 255),
+            )
+        )
+
+    snapshot = []
+    for i in range(rows):
+        kind = rnd.random()
+        if kind < 0.4:
+            src, dst = local(), wan()
+        elif kind < 0.8:
+            src, dst = wan(), local()
+        elif kind < 0.95:
+            src, dst = local(), local()
+        else:
+            src, dst = wan(), wan()
+
+        snapshot.append(
+            {
+                ".id": f"*{i}",
+                "src-address": src,
+                "dst-address": dst,
+                "bytes": rnd.randrange(40, 10**6),
+            }
+        )
+
+    return snapshot
+
+
+# ---------------------------
+#   aggregate_loop
+# ---------------------------
+def aggregate_loop(snapshot, networks, addresses) -> dict:
+    """Reference per-row loop used by process_accounting before."""
+    traffic = {
+        address: dict.fromkeys(accounting.TRAFFIC_KEYS, 0) for address in addresses
+    }
+
+    def is_local(address):
+        address = ip_address(address)
+        return any(address in network for network in networks)
+
+    for item in snapshot:
+        source_ip = str(item.get("src-address")).strip()
+        destination_ip = str(item.get("dst-address")).strip()
+        bits_count = int(str(item.get("bytes")).strip())
+        if is_local(source_ip) and is_local(destination_ip):
+            if source_ip in traffic:
+                traffic[source_ip]["lan-tx"] += bits_count
+            if destination_ip in traffic:
+                traffic[destination_ip]["lan-rx"] += bits_count
+        elif is_local(source_ip) and not is_local(destination_ip):
+            if source_ip in traffic:
+                traffic[source_ip]["wan-tx"] += bits_count
+        elif (
+            not is_local(source_ip)
+            and is_local(destination_ip)
+            and destination_ip in traffic
+        ):
+            traffic[destination_ip]["wan-rx"] += bits_count
+
+    return traffic
+
+
+# ---------------------------
+#   best_of
+# ---------------------------
+def best_of(func, repeat=5) -> tuple:
+    """Return result and best run time of func in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    return result, best
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    classifier = NetworkClassifier(NETWORKS)
+    numpy = accounting.np
+    print(f"{len(HOSTS)} hosts, {len(NETWORKS)} local networks, best of 5")
+    print(f"  {'rows':>8} {'old loop':>10} {'python':>10} {'numpy':>10}  equal")
+    for rows in args.rows:
+        snapshot = make_snapshot(rows)
+        expected, loop_time = best_of(lambda: aggregate_loop(snapshot, NETWORKS, HOSTS))
+
+        accounting.np = None
+        python_result, python_time = best_of(
+            lambda: accounting.aggregate_traffic(snapshot, classifier, HOSTS)
+        )
+        accounting.np = numpy
+
+        numpy_time = None
+        equal = python_result == expected
+        if numpy is not None:
+            numpy_result, numpy_time = best_of(
+                lambda: accounting.aggregate_traffic(snapshot, classifier, HOSTS)
+            )
+            equal = equal and numpy_result == expected
+
+        numpy_column = f"{numpy_time * 1000:>8.0f}ms" if numpy_time else "       n/a"
+        print(
+            f"  {rows:>8} {loop_time * 1000:>8.0f}ms {python_time * 1000:>8.0f}ms"
+            f" {numpy_column}  {equal}"
+        )
+
+
+if __name__ == "__main__":
+    main()
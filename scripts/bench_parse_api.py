@@ -0,0 +1,213 @@
+"""Benchmark parse_api throughput on 10k row arp and filter tables.
+
+Usage: python scripts/bench_parse_api.py [--rev REV] [--rows N]
+
+--rev loads apiparser.py from a git revision instead of the working tree,
+e.g. --rev b7da5eb for the parser before schema compilation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+ARP_VALS = [
+    {"name": "mac-address"},
+    {"name": "address"},
+    {"name": "interface"},
+    {"name": "status", "default": "unknown"},
+]
+ARP_ENSURE_VALS = [{"name": "bridge", "default": ""}]
+
+FILTER_VALS = [
+    {"name": ".id"},
+    {"name": "chain"},
+    {"name": "action"},
+    {"name": "address-list"},
+    {"name": "protocol", "default": "any"},
+    {"name": "in-interface", "default": "any"},
+    {"name": "in-interface-list", "default": "any"},
+    {"name": "out-interface", "default": "any"},
+    {"name": "out-interface-list", "default": "any"},
+    {"name": "src-address", "default": "any"},
+    {"name": "src-address-list", "default": "any"},
+    {"name": "src-port", "default": "any"},
+    {"name": "dst-address", "default": "any"},
+    {"name": "dst-address-list", "default": "any"},
+    {"name": "dst-port", "default": "any"},
+    {"name": "layer7-protocol", "default": "any"},
+    {"name": "connection-state", "default": "any"},
+    {"name": "tcp-flags", "default": "any"},
+    {"name": "comment"},
+    {"name": "enabled", "source": "disabled", "type": "bool", "reverse": True},
+]
+FILTER_VAL_PROC = [
+    [
+        {"name": "uniq-id"},
+        {"action": "combine"},
+        {"key": "chain"},
+        {"text": ","},
+        {"key": "action"},
+        {"text": ","},
+        {"key": "protocol"},
+        {"text": ","},
+        {"key": "layer7-protocol"},
+        {"text": ","},
+        {"key": "in-interface"},
+        {"text": ","},
+        {"key": "in-interface-list"},
+        {"text": ":"},
+        {"key": "src-address"},
+        {"text": ","},
+        {"key": "src-address-list"},
+        {"text": ":"},
+        {"key": "src-port"},
+        {"text": "-"},
+        {"key": "out-interface"},
+        {"text": ","},
+        {"key": "out-interface-list"},
+        {"text": ":"},
+        {"key": "dst-address"},
+        {"text": ","},
+        {"key": "dst-address-list"},
+        {"text": ":"},
+        {"key": "dst-port"},
+    ],
+    [
+        {"name": "name"},
+        {"action": "combine"},
+        {"key": "action"},
+        {"text": ","},
+        {"key": "protocol"},
+        {"text": ":"},
+        {"key": "dst-port"},
+    ],
+]
+FILTER_SKIP = [
+    {"name": "dynamic", "value": True},
+    {"name": "action", "value": "jump"},
+]
+
+
+# ---------------------------
+#   load_parse_api
+# ---------------------------
+def load_parse_api(rev):
+    """Return parse_api from the working tree or a git revision."""
+    if rev is None:
+        from custom_components.mikrotik_router.apiparser import parse_api
+
+        return parse_api
+
+    source = subprocess.run(
+        ["git", "show", f"{rev}:custom_components/mikrotik_router/apiparser.py"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType("custom_components.mikrotik_router.apiparser_rev")
+    module.__package__ = "custom_components.mikrotik_router"
+    # Dataclasses look up their module while the source is executed
+    sys.modules[module.__name__] = module
+    exec(compile(source, f"{rev}:apiparser.py", "exec"), module.__dict__)
+    return module.parse_api
+
+
+# ---------------------------
+#   make_tables
+# ---------------------------
+def make_tables(rows) -> tuple:
+    """Return synthetic arp and filter print replies."""
+    rnd = random.Random(1)
+    arp = [
+        {
+            ".id": f"*{i:X}",
+            "address": f"10.{i // 65536}.{i // 256 % 256}.{i % 256}",
+            "mac-address": ":".join(f"{rnd.randrange(256):02X}" for _ in range(6)),
+            "interface": f"ether{i % 8}",
+            "status": "reachable",
+            "dynamic": True,
+            "complete": True,
+        }
+        for i in range(rows)
+    ]
+    filter_rules = [
+        {
+            ".id": f"*{i:X}",
+            "chain": "forward",
+            "action": ("accept", "drop", "jump")[i % 3],
+            "protocol": "tcp",
+            "dst-port": str(1000 + i),
+            "in-interface": "ether1",
+            "out-interface": "ether2",
+            "comment": f"rule {i}",
+            "disabled": i % 5 == 0,
+            "dynamic": i % 7 == 0,
+            "bytes": i * 1000,
+            "packets": i,
+        }
+        for i in range(rows)
+    ]
+    return arp, filter_rules
+
+
+# ---------------------------
+#   best_of
+# ---------------------------
+def best_of(func, repeat=5) -> float:
+    """Return best run time of func in seconds."""
+    func()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rev", help="git revision of apiparser.py to measure")
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    parse_api = load_parse_api(args.rev)
+    arp, filter_rules = make_tables(args.rows)
+
+    def parse_arp():
+        parse_api(
+            data={},
+            source=arp,
+            key="mac-address",
+            vals=ARP_VALS,
+            ensure_vals=ARP_ENSURE_VALS,
+        )
+
+    def parse_filter():
+        parse_api(
+            data={},
+            source=filter_rules,
+            key=".id",
+            vals=FILTER_VALS,
+            val_proc=FILTER_VAL_PROC,
+            skip=FILTER_SKIP,
+        )
+
+    print(f"parse_api {args.rev or 'working tree'}, {args.rows} rows, best of 5")
+    for name, func in (("/ip/arp", parse_arp), ("/ip/firewall/filter", parse_filter)):
+        print(f"  {name:<20} {args.rows / best_of(func):>10,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()